@@ -3,10 +3,11 @@ Flask Web Application for ONA Quality Dashboard
 Serves the dashboard online and provides auto-refresh functionality
 """
 
-from flask import Flask, render_template, jsonify, send_file, request
+from flask import Flask, render_template, jsonify, send_file, request, make_response
 from flask_cors import CORS
 import pandas as pd
 import json
+import gzip
 import os
 import logging
 from datetime import datetime
@@ -171,6 +172,14 @@ def index():
         dashboard_html = dashboard_html.replace('</head>', f'{refresh_tag}</head>')
         dashboard_html = dashboard_html.replace('<body>', f'<body>{update_info}')
         
+        # The figure JSON is highly repetitive; gzip cuts the transfer several-fold
+        if 'gzip' in request.headers.get('Accept-Encoding', ''):
+            response = make_response(gzip.compress(dashboard_html.encode('utf-8'), compresslevel=6))
+            response.headers['Content-Encoding'] = 'gzip'
+            response.headers['Content-Type'] = 'text/html; charset=utf-8'
+            response.headers['Vary'] = 'Accept-Encoding'
+            return response
+        
         return dashboard_html
         
     except Exception as e:
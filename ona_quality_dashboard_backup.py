@@ -2,21 +2,127 @@
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import plotly.io as pio
+from plotly.offline import get_plotlyjs_version
 import logging
+import os
+import re
+import hashlib
+from pathlib import Path
+import traceback
+from functools import lru_cache
 from datetime import datetime, timedelta
 import numpy as np
 from collections import Counter
+try:
+    import polars as pl
+except ImportError:  # fall back to the pyarrow reader
+    pl = None
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:  # fall back to the pandas C parser
+    pa = None
+
+try:
+    import orjson  # noqa: F401
+except ImportError:  # Plotly keeps its stdlib JSON encoder
+    orjson = None
+
+# pandas' default NA markers, so the pyarrow reader flags the same missing answers
+CSV_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+    '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+
+# ONA timestamp columns, converted to datetimes on load
+DATE_COLUMNS = ['start', 'end', 'today', '_submission_time']
+
+# GPS fixes and interview minutes carry a handful of significant digits;
+# float32 holds them exactly enough at half the memory traffic
+FLOAT32_COLUMNS = ('latitude', 'longitude', 'duration_minutes')
+
+# Beneficiary/non-beneficiary question in the ONA form
+TREATMENT_COLUMN = 'respondent_information/treatment'
+
+# Treatment answers as exported by ONA -> pivot table labels; anything else is 'Unknown'
+TREATMENT_LABELS = {'Beneficiary': 'Beneficiary', 'NotBeneficiary': 'Non-Beneficiary'}
+
+# Above this many interviews the map shows a stable random sample; a denser
+# cloud adds nothing a person can read and bloats the HTML
+MAX_MAP_POINTS = 10_000
+# Above this many fixes the map draws one bubble per ~100 m cell (3 decimals)
+MAP_BIN_THRESHOLD = 5_000
+
+# An unchanged dashboard is reused for at most this long, so its "Last Updated"
+# stamp and TODAY / last-24-hours panels never fall far behind the clock
+DASHBOARD_REUSE_WINDOW = timedelta(minutes=5)
+
+if orjson is not None:
+    # Serialize figures with orjson (native numpy arrays) rather than the stdlib encoder
+    pio.json.config.default_engine = 'orjson'
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Static page the figure JSON is dropped into; plotly.js is loaded from the CDN
+DASHBOARD_HTML_TEMPLATE = """<html>
+<head><meta charset="utf-8" /></head>
+<body>
+    <div id="dashboard" style="height:100%; width:100%;"></div>
+    <script src="https://cdn.plot.ly/plotly-{plotlyjs_version}.min.js" charset="utf-8"></script>
+    <script type="text/javascript">
+        var figure = {figure_json};
+        Plotly.newPlot('dashboard', figure.data, figure.layout, {{"responsive": true}});
+    </script>
+</body>
+</html>
+"""
+
+
+def _write_dashboard_html(fig, output_file):
+    """Write the figure into the static page, skipping plotly.js inlining and re-validation"""
+    # Escape '</' so text in the data cannot close the script tag
+    figure_json = pio.to_json(fig, validate=False).replace('</', '<\\/')
+    html = DASHBOARD_HTML_TEMPLATE.format(
+        plotlyjs_version=get_plotlyjs_version(), figure_json=figure_json
+    )
+    with open(output_file, 'wb') as f:
+        f.write(html.encode('utf-8'))
+
+
+@lru_cache(maxsize=None)
+def _keyword_pattern(keywords):
+    """One compiled alternation per keyword tuple, matched against lowercased column names"""
+    return re.compile('|'.join(re.escape(keyword.lower()) for keyword in keywords))
+
+
 class ONAQualityDashboard:
+    """
+    Enhanced ONA data quality dashboard.
+    
+    When ``orjson`` is installed, Plotly is set to use it (with native numpy
+    array support) to serialize the figure in ``generate_dashboard``.
+    """
+    
     def __init__(self, data_file, config=None):
         """Initialize dashboard with data file and optional config"""
         self.data_file = data_file
         self.config = config or {}
         self.df = None
         self.district_col = None
+        self._lower_columns = None  # [(lowercased name, name)], built by load_data
+        self._null_counts = None  # per-column null counts of the loaded survey data
+        self._is_valid = None  # bool ndarray, set by generate_dashboard
+        self._n_valid = 0
+        self._n_too_long = 0
+        self._is_too_long = None  # bool ndarrays, set by generate_dashboard
+        self._is_too_short = None
+        self._n_gps = None  # rows with both coordinates, set by generate_dashboard
+        self._last_signature = None  # fingerprint of the last generated dashboard
+        self._last_generated = None  # when it was written
+        self._metrics_cache = {}  # data fingerprint + columns -> clock-independent metrics
         self.target_districts = ['Bosaso', 'Dhusamareb', 'Beletweyne', 'Baki', 'Gabiley']
         
         # Target configurations
@@ -30,36 +136,358 @@ class ONAQualityDashboard:
         
         self.beneficiary_ratio = self.config.get('beneficiary_ratio', 0.5)  # 50% beneficiaries target
         
+        # Optional known schema, e.g. {'latitude': 'float32', 'duration_minutes': 'float32'};
+        # the readers use it instead of inferring those columns
+        self.column_dtypes = self.config.get('column_dtypes', {})
+        
+        # Optional subset of columns to read; the rest of the export is never parsed
+        self.usecols = self.config.get('usecols')
+        
+        # Parquet cache location, None to disable
+        self.cache_dir = self.config.get('cache_dir')
+        
+        # Cap on points drawn on the GPS map
+        self.map_max_points = self.config.get('map_max_points', MAX_MAP_POINTS)
+        
+    def _parquet_cache_path(self):
+        """Cache file for this exact version of the export (path, mtime, size), schema and column subset"""
+        source_key = (
+            os.path.abspath(self.data_file), os.path.getmtime(self.data_file),
+            os.path.getsize(self.data_file), sorted(self.column_dtypes.items()),
+            sorted(self.usecols) if self.usecols else None
+        )
+        digest = hashlib.sha1(repr(('dashboard_df', source_key)).encode()).hexdigest()[:20]
+        return Path(self.cache_dir).expanduser() / f"{self._cache_prefix()}{digest}.parquet"
+    
+    def _cache_prefix(self):
+        """File name prefix shared by every cache entry of this export's path"""
+        return hashlib.sha1(os.path.abspath(self.data_file).encode()).hexdigest()[:12] + '-'
+    
+    def _evict_stale_cache(self, keep, suffix):
+        """Delete this export's other cache entries with the given suffix; only the newest is kept"""
+        for path in keep.parent.glob(f"{self._cache_prefix()}*{suffix}"):
+            if path != keep:
+                try:
+                    path.unlink()
+                except OSError as e:
+                    logger.warning("Could not remove stale cache file %s: %s", path, e)
+    
+    def _read_parquet_cache(self):
+        """Return the prepared frame saved by an earlier load of the same export, or None"""
+        if not self.cache_dir or not os.path.exists(self.data_file):
+            return None
+        
+        path = self._parquet_cache_path()
+        if not path.exists():
+            return None
+        
+        try:
+            return pd.read_parquet(path)
+        except Exception as e:
+            logger.warning("Ignoring unreadable cache file %s: %s", path, e)
+            return None
+    
+    def _write_parquet_cache(self, df):
+        """Save the prepared frame so the next load of the same export skips CSV parsing"""
+        if not self.cache_dir:
+            return
+        
+        path = self._parquet_cache_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._evict_stale_cache(path, '.parquet')
+            df.to_parquet(path, compression='zstd')
+        except Exception as e:
+            logger.warning("Could not write cache file %s: %s", path, e)
+    
+    def _read_csv(self):
+        """
+        Read the CSV with Polars' lazy multithreaded scan, falling back to
+        pyarrow's streaming reader and then to the pandas C parser
+        
+        ISO timestamps are parsed by the reader itself, so the datetime columns
+        arrive already converted. Columns named in column_dtypes get that dtype;
+        when usecols is set only those columns are parsed.
+        """
+        usecols = None
+        if self.usecols:
+            header = pd.read_csv(self.data_file, nrows=0).columns
+            wanted = set(self.usecols)
+            usecols = [col for col in header if col in wanted]
+        
+        if pl is not None:
+            try:
+                lazy_frame = pl.scan_csv(
+                    self.data_file,
+                    try_parse_dates=True,
+                    infer_schema_length=10_000,
+                    null_values=CSV_NA_VALUES
+                )
+                if usecols is not None:
+                    # Projection pushdown: the scan skips the other columns entirely
+                    lazy_frame = lazy_frame.select(usecols)
+                df = lazy_frame.collect().to_pandas()
+                dtypes = {col: dtype for col, dtype in self.column_dtypes.items() if col in df.columns}
+                return df.astype(dtypes) if dtypes else df
+            except pl.exceptions.PolarsError as e:
+                logger.warning("Polars could not parse the CSV (%s), trying pyarrow", e)
+        
+        if pa is None:
+            logger.warning("pyarrow not installed, using default CSV parser")
+            return self._read_csv_pandas(usecols)
+        
+        try:
+            reader = pa_csv.open_csv(
+                self.data_file,
+                read_options=pa_csv.ReadOptions(block_size=8 << 20),
+                convert_options=pa_csv.ConvertOptions(
+                    null_values=CSV_NA_VALUES, strings_can_be_null=True,
+                    column_types={
+                        col: pa.from_numpy_dtype(np.dtype(dtype)) for col, dtype in self.column_dtypes.items()
+                    },
+                    include_columns=usecols
+                )
+            )
+            batches = list(reader)
+            table = pa.Table.from_batches(batches, schema=reader.schema)
+            del batches
+            # self_destruct frees each Arrow column as soon as it is converted
+            return table.to_pandas(self_destruct=True, split_blocks=True)
+        except pa.ArrowInvalid as e:
+            logger.warning("pyarrow could not parse the CSV (%s), using default parser", e)
+            return self._read_csv_pandas(usecols)
+    
+    def _read_csv_pandas(self, usecols=None):
+        """Read with the pandas C parser, converting the ISO date columns as it parses"""
+        header = pd.read_csv(self.data_file, nrows=0).columns
+        if usecols is not None:
+            header = usecols
+        return pd.read_csv(
+            self.data_file,
+            usecols=usecols,
+            parse_dates=[col for col in DATE_COLUMNS if col in header],
+            date_format='ISO8601',
+            dtype={col: dtype for col, dtype in self.column_dtypes.items() if col in header}
+        )
+    
     def load_data(self):
-        """Load data from CSV file"""
+        """Load data from CSV file, or from the Parquet copy a previous load of the same file saved"""
         try:
-            self.df = pd.read_csv(self.data_file)
-            logger.info(f"Loaded {len(self.df)} records from {self.data_file}")
+            self.df = self._read_parquet_cache()
+            if self.df is not None:
+                logger.info("Loaded %d records from the cached copy of %s", len(self.df), self.data_file)
+                self._lower_columns = [(col.lower(), col) for col in self.df.columns]
+            else:
+                self.df = self._read_csv()
+                logger.info("Loaded %d records from %s", len(self.df), self.data_file)
+                
+                # Convert date columns
+                for col in DATE_COLUMNS:
+                    # Columns the reader already parsed are left as they are
+                    if col in self.df.columns and not pd.api.types.is_datetime64_any_dtype(self.df[col]):
+                        # ONA exports ISO 8601 timestamps; naming the format skips
+                        # per-value inference, and unparseable values become NaT
+                        parsed = pd.to_datetime(
+                            self.df[col], format='ISO8601', cache=True, errors='coerce'
+                        )
+                        if parsed.isna().sum() > self.df[col].isna().sum():
+                            # Some values are not ISO; infer them one by one instead
+                            parsed = pd.to_datetime(self.df[col], format='mixed', cache=True, errors='coerce')
+                        self.df[col] = parsed
+                
+                # Lowercased once for _find_column's keyword search
+                self._lower_columns = [(col.lower(), col) for col in self.df.columns]
+                
+                self._optimize_dtypes()
+                self._write_parquet_cache(self.df)
             
-            # Convert date columns
-            date_columns = ['start', 'end', 'today', '_submission_time']
-            for col in date_columns:
-                if col in self.df.columns:
-                    self.df[col] = pd.to_datetime(self.df[col])
+            # Counted once, before generate_dashboard adds its helper columns;
+            # every completeness figure and the missing-data chart reuse it
+            self._null_counts = self.df.isnull().sum()
                     
             return True
         except Exception as e:
-            logger.error(f"Error loading data: {e}")
+            logger.error("Error loading data: %s", e)
             return False
     
+    def _optimize_dtypes(self):
+        """Shrink the freshly parsed frame: categoricals for labels, float32 for measurements"""
+        # Few distinct districts/enumerators/treatment answers over many rows: store
+        # them as categoricals so counts and groupbys work on integer codes
+        label_columns = [
+            self._find_column(None, ['district', 'District_id']),
+            self._find_column(None, ['enum', 'enumerator', 'interviewer']),
+            TREATMENT_COLUMN if TREATMENT_COLUMN in self.df.columns else None
+        ]
+        for col in label_columns:
+            if col and self.df[col].dtype == object:
+                self.df[col] = self.df[col].astype('category')
+        
+        for col in FLOAT32_COLUMNS:
+            if col in self.df.columns:
+                self.df[col] = pd.to_numeric(self.df[col], errors='coerce', downcast='float')
+    
+    def load_and_aggregate(self, chunksize=100_000, duration_column='duration_minutes',
+                           min_duration=50, sample_size=500):
+        """
+        Stream the CSV in chunks and accumulate summary metrics without holding it in memory
+        
+        For exports too large for load_data. Memory stays at one chunk plus a
+        sample_size-value uniform sample of durations (for a box plot).
+        
+        Returns a dict with 'total', 'quality_score', 'district_counts',
+        'daily_counts' (Counters), 'duration_sample' and the raw counters, or
+        None if the file cannot be read.
+        """
+        try:
+            header = pd.read_csv(self.data_file, nrows=0).columns
+            self._lower_columns = [(col.lower(), col) for col in header]
+            district_col = self._find_column(None, ['district', 'District_id'])
+            
+            n_rows = n_cells = n_non_null = gps_count = valid_count = 0
+            district_counts = Counter()
+            daily_counts = Counter()
+            rng = np.random.default_rng(0)
+            sample = np.empty(0)
+            sample_keys = np.empty(0)
+            
+            # The pyarrow engine cannot stream, so chunks come from the C parser
+            for chunk in pd.read_csv(self.data_file, chunksize=chunksize):
+                n_rows += len(chunk)
+                n_cells += chunk.size
+                n_non_null += int(chunk.count().sum())
+                
+                if 'latitude' in chunk.columns and 'longitude' in chunk.columns:
+                    gps_count += np.count_nonzero(
+                        np.logical_and(chunk['latitude'].notna().values, chunk['longitude'].notna().values)
+                    )
+                
+                if duration_column in chunk.columns:
+                    durations = chunk[duration_column].to_numpy(dtype=float, na_value=np.nan)
+                    valid_count += np.count_nonzero(durations >= min_duration)
+                    
+                    # Keep the values with the smallest random keys: a uniform
+                    # sample over everything read so far
+                    durations = durations[~np.isnan(durations)]
+                    sample = np.concatenate([sample, durations])
+                    sample_keys = np.concatenate([sample_keys, rng.random(durations.size)])
+                    if sample.size > sample_size:
+                        keep = np.argpartition(sample_keys, sample_size)[:sample_size]
+                        sample, sample_keys = sample[keep], sample_keys[keep]
+                
+                if district_col:
+                    district_counts.update(chunk[district_col].value_counts().to_dict())
+                
+                if '_submission_time' in chunk.columns:
+                    submitted = pd.to_datetime(
+                        chunk['_submission_time'], format='ISO8601', cache=True, errors='coerce'
+                    )
+                    daily_counts.update(submitted.dt.floor('D').value_counts().to_dict())
+            
+            if n_rows == 0:
+                logger.error("No records in %s", self.data_file)
+                return None
+            
+            has_gps = 'latitude' in header and 'longitude' in header
+            has_duration = duration_column in header
+            logger.info("Aggregated %d records from %s in chunks of %d", n_rows, self.data_file, chunksize)
+            return {
+                'total': n_rows,
+                'non_null_cells': n_non_null,
+                'total_cells': n_cells,
+                'gps_count': gps_count if has_gps else None,
+                'valid_count': valid_count if has_duration else None,
+                'district_counts': district_counts,
+                'daily_counts': daily_counts,
+                'duration_sample': sample,
+                'quality_score': self._quality_score_from_counts(
+                    n_rows, n_cells, n_non_null,
+                    gps_count if has_gps else None,
+                    valid_count if has_duration else None
+                )
+            }
+        except Exception as e:
+            logger.error("Error aggregating data: %s", e)
+            return None
+    
+    def _data_signature(self, *args):
+        """
+        Cheap fingerprint of the loaded data, the settings and the call
+        arguments, used to skip regeneration
+        """
+        mtime = os.path.getmtime(self.data_file) if os.path.exists(self.data_file) else None
+        last_submission = self.df['_submission_time'].max() if '_submission_time' in self.df.columns else None
+        # Config values may be lists or dicts, so compare their repr
+        settings = (repr(sorted(self.config.items())), tuple(self.target_districts),
+                    tuple(sorted(self.district_targets.items())))
+        return (mtime, len(self.df), str(last_submission)) + settings + args
+    
     def _find_column(self, column_name, keywords):
         """Find a column by searching for keywords in column names"""
         if column_name and column_name in self.df.columns:
             return column_name
         
-        for col in self.df.columns:
-            col_lower = col.lower()
-            if any(keyword.lower() in col_lower for keyword in keywords):
-                logger.info(f"Found column '{col}' for {keywords}")
+        if self._lower_columns is None:
+            self._lower_columns = [(col.lower(), col) for col in self.df.columns]
+        
+        pattern = _keyword_pattern(tuple(keywords))
+        for col_lower, col in self._lower_columns:
+            if pattern.search(col_lower):
+                logger.info("Found column '%s' for %s", col, keywords)
                 return col
         
         return None
     
+    def _submission_days(self):
+        """Submission times floored to local midnight, kept as datetime64 rather than Python dates"""
+        submission_time = self.df['_submission_time']
+        if submission_time.dt.tz is not None:
+            submission_time = submission_time.dt.tz_localize(None)
+        return submission_time.dt.floor('D')
+    
+    def _gps_count(self):
+        """Rows with both coordinates: generate_dashboard's count, else latitude/longitude counted here"""
+        if self._n_gps is not None:
+            return self._n_gps
+        if 'latitude' in self.df.columns and 'longitude' in self.df.columns:
+            return int(np.count_nonzero(
+                np.logical_and(self.df['latitude'].notna().values, self.df['longitude'].notna().values)
+            ))
+        return None
+    
+    def _column_null_counts(self):
+        """Per-column null counts of the survey data, computed on first use if load_data did not"""
+        if self._null_counts is None:
+            self._null_counts = self.df.isnull().sum()
+        return self._null_counts
+    
+    def _completeness(self):
+        """Percentage of non-null cells in the survey data"""
+        null_counts = self._column_null_counts()
+        return (1 - null_counts.sum() / (len(self.df) * len(null_counts))) * 100
+    
+    @staticmethod
+    def _top_k(series, k):
+        """Return the k most frequent values and their counts, most frequent first"""
+        # Hash-count without sorting, then select the top k in linear time
+        counts = series.value_counts(sort=False)
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Categoricals count in category order (unobserved ones included);
+            # put the counts in first-appearance order like an object column's
+            counts = counts.reindex(pd.unique(series.dropna()))
+        values = counts.to_numpy()
+        if len(values) > k:
+            # Everything above the k-th largest count, then the earliest of the values tied at it
+            kth = np.partition(values, len(values) - k)[len(values) - k]
+            above = np.flatnonzero(values > kth)
+            tied = np.flatnonzero(values == kth)[:k - len(above)]
+            idx = np.sort(np.concatenate([above, tied]))
+        else:
+            idx = np.arange(len(values))
+        # Stable, so equal counts stay in first-appearance order
+        idx = idx[np.argsort(-values[idx], kind='stable')]
+        return counts.index.to_numpy()[idx], values[idx]
+    
     def _create_empty_pivot(self):
         """Create empty pivot table structure"""
         empty_data = {
@@ -87,12 +515,12 @@ class ONAQualityDashboard:
         
         # Check for same enumerator, same day, similar duration
         if '_submission_time' in self.df.columns and 'duration_minutes' in self.df.columns:
-            self.df['submission_date'] = self.df['_submission_time'].dt.date
+            self.df['submission_date'] = self._submission_days()
             
         return duplicates
     
-    def _calculate_progress_tracker(self, district_col):
-        """Calculate collection progress vs targets"""
+    def _calculate_progress_tracker(self, district_col, district_counts=None):
+        """Calculate collection progress vs targets; district_counts reuses a precomputed value_counts"""
         if not district_col or district_col not in self.df.columns:
             return None
         
@@ -105,7 +533,9 @@ class ONAQualityDashboard:
             'Status': []
         }
         
-        actual_counts = self.df[district_col].value_counts().to_dict()
+        if district_counts is None:
+            district_counts = self.df[district_col].value_counts()
+        actual_counts = district_counts.to_dict()
         
         for district in self.target_districts:
             target = self.district_targets.get(district, 100)
@@ -144,29 +574,29 @@ class ONAQualityDashboard:
         
         return progress
     
-    def _generate_alerts(self, enum_col, duration_col, district_col):
+    def _generate_alerts(self, enum_col, duration_col, district_col, district_counts=None):
         """Generate real-time alerts for issues needing attention"""
         alerts = []
         
         # Check for today's invalid surveys
         if '_submission_time' in self.df.columns and 'is_valid' in self.df.columns:
-            today = datetime.now().date()
-            today_data = self.df[self.df['_submission_time'].dt.date == today]
-            invalid_today = (~today_data['is_valid']).sum()
+            today = pd.Timestamp(datetime.now().date())
+            today_data = self.df[self._submission_days() == today]
+            invalid_today = len(today_data) - int(np.count_nonzero(today_data['is_valid'].to_numpy()))
             if invalid_today > 0:
                 alerts.append(f"⚠️ {invalid_today} invalid surveys submitted TODAY")
         
         # Check for enumerators with high invalid rate
         if enum_col and enum_col in self.df.columns and 'is_valid' in self.df.columns:
-            enum_stats = self.df.groupby(enum_col).agg({
+            enum_stats = self.df.groupby(enum_col, observed=True).agg({
                 'is_valid': ['sum', 'count']
             })
             enum_stats.columns = ['valid', 'total']
             enum_stats['invalid_rate'] = (1 - enum_stats['valid'] / enum_stats['total']) * 100
             
             problem_enums = enum_stats[enum_stats['invalid_rate'] > 50]
-            for enum_name, row in problem_enums.iterrows():
-                alerts.append(f"🚨 Enumerator '{enum_name}' has {row['invalid_rate']:.0f}% invalid rate")
+            for enum_name, invalid_rate in zip(problem_enums.index, problem_enums['invalid_rate'].to_numpy()):
+                alerts.append(f"🚨 Enumerator '{enum_name}' has {invalid_rate:.0f}% invalid rate")
         
         # Check for districts with no recent submissions
         if '_submission_time' in self.df.columns and district_col and district_col in self.df.columns:
@@ -179,8 +609,9 @@ class ONAQualityDashboard:
                     alerts.append(f"📍 No submissions from {district} in last 24 hours")
         
         # Check for missing GPS
-        if 'latitude' in self.df.columns and 'longitude' in self.df.columns:
-            missing_gps = self.df[['latitude', 'longitude']].isna().any(axis=1).sum()
+        n_gps = self._gps_count()
+        if n_gps is not None:
+            missing_gps = len(self.df) - n_gps
             if missing_gps > 0:
                 alerts.append(f"📍 {missing_gps} surveys missing GPS coordinates")
         
@@ -190,7 +621,9 @@ class ONAQualityDashboard:
         
         # Check progress for districts far behind
         if district_col and district_col in self.df.columns:
-            actual_counts = self.df[district_col].value_counts().to_dict()
+            if district_counts is None:
+                district_counts = self.df[district_col].value_counts()
+            actual_counts = district_counts.to_dict()
             for district in self.target_districts:
                 target = self.district_targets.get(district, 100)
                 actual = actual_counts.get(district, 0)
@@ -208,13 +641,14 @@ class ONAQualityDashboard:
             return None
         
         now = datetime.now()
-        today = now.date()
+        today = pd.Timestamp(now.date())
         yesterday = today - timedelta(days=1)
         week_start = today - timedelta(days=7)
         
-        today_data = self.df[self.df['_submission_time'].dt.date == today]
-        yesterday_data = self.df[self.df['_submission_time'].dt.date == yesterday]
-        week_data = self.df[self.df['_submission_time'].dt.date >= week_start]
+        submission_days = self._submission_days()
+        today_data = self.df[submission_days == today]
+        yesterday_data = self.df[submission_days == yesterday]
+        week_data = self.df[submission_days >= week_start]
         
         summary = {
             'Period': ['TODAY', 'YESTERDAY', 'THIS WEEK'],
@@ -242,24 +676,29 @@ class ONAQualityDashboard:
         if not enum_col or enum_col not in self.df.columns:
             return None, None
         
-        enum_stats = []
-        
-        for enum in self.df[enum_col].unique():
-            enum_data = self.df[self.df[enum_col] == enum]
-            
-            total = len(enum_data)
-            valid = enum_data['is_valid'].sum() if 'is_valid' in enum_data.columns else total
-            valid_pct = (valid / total * 100) if total > 0 else 0
-            avg_duration = enum_data[duration_col].mean() if duration_col in enum_data.columns else 0
-            
-            enum_stats.append({
+        # One grouped pass for every enumerator instead of a boolean filter per enumerator;
+        # sort=False keeps first-appearance order, which breaks score ties below
+        groups = self.df.groupby(enum_col, sort=False, observed=True)
+        stats = groups.size().to_frame('total')
+        stats['valid'] = groups['is_valid'].sum() if 'is_valid' in self.df.columns else stats['total']
+        stats['valid_pct'] = stats['valid'] / stats['total'] * 100
+        stats['avg_duration'] = groups[duration_col].mean() if duration_col in self.df.columns else 0
+        stats['score'] = stats['valid_pct'] * 0.7 + np.minimum(100, (stats['total'] / 10) * 10) * 0.3  # Composite score
+        
+        enum_stats = [
+            {
                 'enumerator': str(enum),
                 'total': total,
                 'valid': valid,
                 'valid_pct': valid_pct,
                 'avg_duration': avg_duration,
-                'score': valid_pct * 0.7 + min(100, (total / 10) * 10) * 0.3  # Composite score
-            })
+                'score': score
+            }
+            for enum, total, valid, valid_pct, avg_duration, score in zip(
+                stats.index, stats['total'], stats['valid'], stats['valid_pct'],
+                stats['avg_duration'], stats['score']
+            )
+        ]
         
         # Sort by score
         enum_stats.sort(key=lambda x: x['score'], reverse=True)
@@ -315,17 +754,18 @@ class ONAQualityDashboard:
         dimensions = {}
         
         # Completeness
-        completeness = (1 - self.df.isnull().sum().sum() / (len(self.df) * len(self.df.columns))) * 100
+        completeness = self._completeness()
         dimensions['Completeness'] = completeness
         
         # Duration Validity
-        if 'is_valid' in self.df.columns:
-            duration_validity = (self.df['is_valid'].sum() / len(self.df)) * 100
+        if self._is_valid is not None:
+            duration_validity = (self._n_valid / len(self.df)) * 100
             dimensions['Duration Validity'] = duration_validity
         
         # GPS Accuracy
-        if 'latitude' in self.df.columns and 'longitude' in self.df.columns:
-            gps_accuracy = (self.df[['latitude', 'longitude']].notna().all(axis=1).sum() / len(self.df)) * 100
+        n_gps = self._gps_count()
+        if n_gps is not None:
+            gps_accuracy = (n_gps / len(self.df)) * 100
             dimensions['GPS Accuracy'] = gps_accuracy
         
         # Logical Consistency (no extreme outliers in key fields)
@@ -343,9 +783,9 @@ class ONAQualityDashboard:
         
         return dimensions
     
-    def _calculate_beneficiary_balance(self, district_col):
-        """Calculate beneficiary balance scorecard"""
-        treatment_col = 'respondent_information/treatment'
+    def _calculate_beneficiary_balance(self, district_col, district_groups=None):
+        """Calculate beneficiary balance scorecard; district_groups reuses a groupby on district_col"""
+        treatment_col = TREATMENT_COLUMN
         
         if treatment_col not in self.df.columns or not district_col or district_col not in self.df.columns:
             return None
@@ -359,11 +799,17 @@ class ONAQualityDashboard:
             'Status': []
         }
         
-        for district in self.target_districts:
-            district_data = self.df[self.df[district_col] == district]
-            
-            beneficiaries = (district_data[treatment_col] == 'Beneficiary').sum()
-            non_beneficiaries = (district_data[treatment_col] == 'NotBeneficiary').sum()
+        # One grouped count over the frame instead of a filter per district
+        if district_groups is None:
+            district_groups = self.df.groupby(district_col, sort=False, observed=True)
+        counts = district_groups[treatment_col].value_counts().unstack(fill_value=0)
+        counts = counts.reindex(
+            index=self.target_districts, columns=['Beneficiary', 'NotBeneficiary'], fill_value=0
+        )
+        
+        for district, beneficiaries, non_beneficiaries in zip(
+            self.target_districts, counts['Beneficiary'].to_numpy(), counts['NotBeneficiary'].to_numpy()
+        ):
             total = beneficiaries + non_beneficiaries
             
             if total > 0:
@@ -395,12 +841,23 @@ class ONAQualityDashboard:
         if '_submission_time' not in self.df.columns:
             return None, None
         
+        # Hour and weekday straight from epoch seconds instead of the .dt accessors
+        submission_time = self.df['_submission_time']
+        if submission_time.dt.tz is not None:
+            submission_time = submission_time.dt.tz_localize(None)
+        stamps = submission_time.to_numpy(dtype='datetime64[s]')
+        has_time = ~np.isnat(stamps)
+        seconds = stamps.astype(np.int64)
+        hours = ((seconds // 3600) % 24).astype(np.int8)
+        weekday = (seconds // 86400 + 3) % 7  # 1970-01-01 was a Thursday (Monday=0)
+        
         # Peak hours analysis
-        self.df['hour'] = self.df['_submission_time'].dt.hour
-        hourly_counts = self.df['hour'].value_counts().sort_index()
+        self.df['hour'] = pd.Series(hours, index=self.df.index).where(has_time)
+        hour_totals = np.bincount(hours[has_time], minlength=24)
+        hourly_counts = pd.Series(hour_totals, index=np.arange(24))[hour_totals > 0]
         
         # Weekend vs weekday
-        self.df['is_weekend'] = self.df['_submission_time'].dt.dayofweek >= 5
+        self.df['is_weekend'] = has_time & (weekday >= 5)
         weekend_data = self.df[self.df['is_weekend']]
         weekday_data = self.df[~self.df['is_weekend']]
         
@@ -420,7 +877,7 @@ class ONAQualityDashboard:
     def _create_beneficiary_pivot_table(self):
         """Create beneficiary vs non-beneficiary comparison table"""
         try:
-            treatment_col = 'respondent_information/treatment'
+            treatment_col = TREATMENT_COLUMN
             
             if treatment_col not in self.df.columns:
                 print(f"\n✗ Treatment column '{treatment_col}' not found!")
@@ -428,44 +885,29 @@ class ONAQualityDashboard:
             
             print(f"\n✓ Found treatment column: {treatment_col}")
             
-            analysis_df = self.df[[self.district_col, treatment_col]].copy()
-            
-            def categorize_treatment(val):
-                if pd.isna(val):
-                    return 'Unknown'
-                val_str = str(val).strip()
-                if val_str == 'Beneficiary':
-                    return 'Beneficiary'
-                elif val_str == 'NotBeneficiary':
-                    return 'Non-Beneficiary'
-                else:
-                    return 'Unknown'
-            
-            analysis_df['Beneficiary_Status'] = analysis_df[treatment_col].apply(categorize_treatment)
-            
-            pivot = pd.crosstab(
-                analysis_df[self.district_col],
-                analysis_df['Beneficiary_Status'],
-                margins=True,
-                margins_name='Total'
+            # Label each distinct answer once, then expand by the factorized codes;
+            # missing answers get code -1, which picks the trailing 'Unknown'
+            codes, answers = pd.factorize(self.df[treatment_col])
+            labels = np.array(
+                [TREATMENT_LABELS.get(str(answer).strip(), 'Unknown') for answer in answers] + ['Unknown']
             )
+            status = pd.Series(labels[codes], index=self.df.index, name='Beneficiary_Status')
             
-            for district in self.target_districts:
-                if district not in pivot.index:
-                    pivot.loc[district] = 0
+            # One grouped count; margins come from sums of that small table
+            pivot = self.df.groupby([self.df[self.district_col], status], observed=True).size().unstack(fill_value=0)
+            # Plain labels, so the target districts and the 'Total' row can be added
+            pivot.index = pivot.index.astype(object)
             
-            for status in ['Beneficiary', 'Non-Beneficiary']:
-                if status not in pivot.columns:
-                    pivot[status] = 0
-            
-            cols_order = [col for col in ['Beneficiary', 'Non-Beneficiary', 'Unknown', 'Total'] 
-                         if col in pivot.columns]
-            pivot = pivot[cols_order]
-            
-            district_order = [d for d in self.target_districts if d in pivot.index]
-            if 'Total' in pivot.index:
-                district_order.append('Total')
-            pivot = pivot.loc[district_order]
+            # One reindex adds the missing target districts/statuses as zeros and
+            # fixes the order, instead of growing the table a row or column at a time
+            cols_order = ['Beneficiary', 'Non-Beneficiary']
+            if 'Unknown' in pivot.columns:
+                cols_order.append('Unknown')
+            pivot = pivot.reindex(columns=cols_order, fill_value=0)
+            totals = pivot.sum()
+            pivot = pivot.reindex(index=self.target_districts, fill_value=0)
+            pivot.loc['Total'] = totals
+            pivot['Total'] = pivot.sum(axis=1)
             
             result = {'District': list(pivot.index)}
             for col in pivot.columns:
@@ -475,7 +917,6 @@ class ONAQualityDashboard:
             
         except Exception as e:
             print(f"\n✗ Error creating beneficiary pivot: {str(e)}")
-            import traceback
             traceback.print_exc()
             return self._create_empty_pivot()
     
@@ -492,6 +933,15 @@ class ONAQualityDashboard:
             logger.error("No data available to generate dashboard")
             return False
         
+        # The date is part of the fingerprint: TODAY/YESTERDAY counts change at midnight
+        now = datetime.now()
+        signature = self._data_signature(now.date(), output_file, title, district_column, duration_column,
+                                         enumerator_column, lat_column, lon_column)
+        if (signature == self._last_signature and os.path.exists(output_file)
+                and now - self._last_generated < DASHBOARD_REUSE_WINDOW):
+            logger.info("Data unchanged since last run, keeping %s", output_file)
+            return True
+        
         try:
             # Smart column detection
             district_column = self._find_column(district_column, ['district', 'District_id'])
@@ -501,22 +951,71 @@ class ONAQualityDashboard:
             min_duration_threshold = 50
             max_duration_threshold = self.config.get('max_duration', 120)
             
-            logger.info(f"Generating enhanced dashboard with all features...")
+            logger.info("Generating enhanced dashboard with all features...")
+            
+            # Column presence is fixed for the rest of the build; check it once
+            n_rows = len(self.df)
+            columns = frozenset(self.df.columns)
+            has_district = bool(district_column) and district_column in columns
+            has_duration = duration_column in columns
+            has_enumerator = bool(enumerator_column) and enumerator_column in columns
+            has_gps = lat_column in columns and lon_column in columns
+            has_submission_time = '_submission_time' in columns
             
             # Mark invalid interviews
-            if duration_column in self.df.columns:
-                self.df['is_valid'] = self.df[duration_column] >= min_duration_threshold
-                self.df['is_too_long'] = self.df[duration_column] > max_duration_threshold
-                self.df['is_too_short'] = self.df[duration_column] < min_duration_threshold
+            if has_duration:
+                durations = self.df[duration_column].to_numpy(dtype=float, na_value=np.nan)
+                self._is_valid = durations >= min_duration_threshold
+                self._n_valid = int(np.count_nonzero(self._is_valid))
+                # Kept as a column for the per-group aggregations
+                self.df['is_valid'] = self._is_valid
+                # The too long/short flags are only read as arrays, so they stay off the frame
+                self._is_too_long = durations > max_duration_threshold
+                self._is_too_short = durations < min_duration_threshold
+                self._n_too_long = int(np.count_nonzero(self._is_too_long))
+            else:
+                self._is_valid = None
+                self._n_valid = 0
+                self._is_too_long = self._is_too_short = None
+                self._n_too_long = 0
+            
+            # District groups are factorized once; their sizes feed the tracker, alerts,
+            # bar chart and stats, and the groups themselves the beneficiary balance
+            district_groups = district_counts = None
+            if has_district:
+                district_groups = self.df.groupby(district_column, sort=False, observed=True)
+                district_counts = district_groups.size()
+            
+            # One pass over the coordinate columns feeds the GPS counts, the map and its centre
+            gps_lat = gps_lon = None
+            self._n_gps = None
+            if has_gps:
+                gps_lat = self.df[lat_column].to_numpy(dtype=np.float32, na_value=np.nan)
+                gps_lon = self.df[lon_column].to_numpy(dtype=np.float32, na_value=np.nan)
+                has_coords = ~(np.isnan(gps_lat) | np.isnan(gps_lon))
+                gps_lat, gps_lon = gps_lat[has_coords], gps_lon[has_coords]
+                self._n_gps = gps_lat.size
             
-            # Calculate all metrics
-            progress_data = self._calculate_progress_tracker(district_column)
-            alerts = self._generate_alerts(enumerator_column, duration_column, district_column)
+            # Calculate all metrics. Alerts and the daily summary depend on the
+            # clock; the rest only on the data, so reruns (e.g. a new title) reuse them
+            metrics_key = self._data_signature(district_column, duration_column, enumerator_column,
+                                               lat_column, lon_column,
+                                               min_duration_threshold, max_duration_threshold)
+            metrics = self._metrics_cache.get(metrics_key)
+            if metrics is None:
+                metrics = (
+                    self._calculate_progress_tracker(district_column, district_counts),
+                    self._calculate_enumerator_leaderboard(enumerator_column, duration_column),
+                    self._calculate_quality_dimensions(duration_column),
+                    self._calculate_beneficiary_balance(district_column, district_groups),
+                    self._calculate_time_analysis()
+                )
+                # Only the latest data is worth keeping
+                self._metrics_cache = {metrics_key: metrics}
+            progress_data, (top_performers, needs_support), quality_dimensions, \
+                beneficiary_balance, (hourly_counts, time_stats) = metrics
+            alerts = self._generate_alerts(enumerator_column, duration_column, district_column, district_counts)
             daily_summary = self._calculate_daily_summary()
-            top_performers, needs_support = self._calculate_enumerator_leaderboard(enumerator_column, duration_column)
-            quality_dimensions = self._calculate_quality_dimensions(duration_column)
-            beneficiary_balance = self._calculate_beneficiary_balance(district_column)
-            hourly_counts, time_stats = self._calculate_time_analysis()
             
             # Create figure with 10 rows for all visualizations
             fig = make_subplots(
@@ -572,9 +1071,16 @@ class ONAQualityDashboard:
                 'info': '#4facfe'
             }
             
+            # Traces are queued and handed to plotly in one add_traces call below,
+            # so the subplot grid is resolved once rather than per trace
+            queued_traces = []
+            
+            def add_trace(trace, row, col):
+                queued_traces.append((trace, row, col))
+            
             # 1. PROGRESS TRACKER TABLE
             if progress_data:
-                fig.add_trace(
+                add_trace(
                     go.Table(
                         header=dict(
                             values=list(progress_data.keys()),
@@ -589,7 +1095,8 @@ class ONAQualityDashboard:
                             font=dict(color='#333', size=11),
                             align='center',
                             height=28
-                        )
+                        ),
+                        _validate=False
                     ),
                     row=1, col=1
                 )
@@ -597,7 +1104,7 @@ class ONAQualityDashboard:
             # 2. ALERTS PANEL
             if alerts:
                 alerts_html = '<br>'.join([f"<b>{i+1}.</b> {alert}" for i, alert in enumerate(alerts)])
-                fig.add_trace(
+                add_trace(
                     go.Table(
                         header=dict(
                             values=['<b>🚨 IMMEDIATE ATTENTION NEEDED</b>'],
@@ -612,14 +1119,15 @@ class ONAQualityDashboard:
                             font=dict(color='#333', size=10),
                             align='left',
                             height=25
-                        )
+                        ),
+                        _validate=False
                     ),
                     row=1, col=3
                 )
             
             # 3. DAILY SUMMARY
             if daily_summary:
-                fig.add_trace(
+                add_trace(
                     go.Table(
                         header=dict(
                             values=list(daily_summary.keys()),
@@ -634,7 +1142,8 @@ class ONAQualityDashboard:
                             font=dict(color='#333', size=13, family='Arial Black'),
                             align='center',
                             height=35
-                        )
+                        ),
+                        _validate=False
                     ),
                     row=1, col=3
                 )
@@ -646,7 +1155,7 @@ class ONAQualityDashboard:
                 for i, (dim, score) in enumerate(quality_dimensions.items()):
                     color = colors['success'] if score >= 80 else colors['warning'] if score >= 60 else colors['danger']
                     
-                    fig.add_trace(
+                    add_trace(
                         go.Indicator(
                             mode="gauge+number",
                             value=score,
@@ -660,7 +1169,8 @@ class ONAQualityDashboard:
                                     {'range': [80, 100], 'color': '#e8f5e9'}
                                 ]
                             },
-                            domain={'row': 1, 'column': i}
+                            domain={'row': 1, 'column': i},
+                            _validate=False
                         ),
                         row=2, col=1
                     )
@@ -671,33 +1181,35 @@ class ONAQualityDashboard:
                 targets = [progress_data['Target'][i] for i, d in enumerate(progress_data['District']) if d != 'TOTAL']
                 actuals = [progress_data['Actual'][i] for i, d in enumerate(progress_data['District']) if d != 'TOTAL']
                 
-                fig.add_trace(
+                add_trace(
                     go.Bar(
                         name='Target',
                         x=districts,
                         y=targets,
                         marker_color=colors['info'],
                         text=targets,
-                        textposition='outside'
+                        textposition='outside',
+                        _validate=False
                     ),
                     row=3, col=1
                 )
                 
-                fig.add_trace(
+                add_trace(
                     go.Bar(
                         name='Actual',
                         x=districts,
                         y=actuals,
                         marker_color=colors['success'],
                         text=actuals,
-                        textposition='outside'
+                        textposition='outside',
+                        _validate=False
                     ),
                     row=3, col=1
                 )
             
             # 6. TOP PERFORMERS
             if top_performers:
-                fig.add_trace(
+                add_trace(
                     go.Table(
                         header=dict(
                             values=list(top_performers.keys()),
@@ -712,112 +1224,144 @@ class ONAQualityDashboard:
                             font=dict(color='#333', size=10),
                             align='center',
                             height=28
-                        )
+                        ),
+                        _validate=False
                     ),
                     row=3, col=3
                 )
             
             # 7-9. STANDARD CHARTS (Surveys, Duration, Enumerators)
-            if district_column and district_column in self.df.columns:
-                district_data = self.df[district_column].value_counts().sort_values(ascending=True)
-                fig.add_trace(
+            if has_district:
+                # Plain numpy arrays go to plotly as-is; no sorted Series/Index round trip
+                counts = district_counts.to_numpy()
+                order = np.argsort(counts, kind='stable')
+                add_trace(
                     go.Bar(
-                        y=district_data.index,
-                        x=district_data.values,
+                        y=district_counts.index.to_numpy()[order],
+                        x=counts[order],
                         orientation='h',
                         marker_color=colors['primary'],
-                        text=district_data.values,
-                        textposition='outside'
+                        text=counts[order],
+                        textposition='outside',
+                        _validate=False
                     ),
                     row=4, col=1
                 )
             
-            if duration_column in self.df.columns:
-                fig.add_trace(
+            if has_duration:
+                # A fixed 500-point sample is plenty for the box and keeps the HTML small
+                durations = self.df[duration_column].to_numpy(dtype=np.float32, na_value=np.nan)
+                durations = durations[~np.isnan(durations)]
+                if durations.size > 500:
+                    durations = durations[np.random.default_rng(0).choice(durations.size, 500, replace=False)]
+                add_trace(
                     go.Box(
-                        y=self.df[duration_column],
+                        y=durations,
                         marker_color=colors['primary'],
-                        name='Duration'
+                        name='Duration',
+                        _validate=False
                     ),
                     row=4, col=2
                 )
-                fig.add_hline(y=min_duration_threshold, line_dash="solid", line_color="red", line_width=2, row=4, col=2)
             
-            if enumerator_column and enumerator_column in self.df.columns:
-                enum_data = self.df[enumerator_column].value_counts().head(10)
-                fig.add_trace(
+            if has_enumerator:
+                enum_names, enum_counts = self._top_k(self.df[enumerator_column], 10)
+                add_trace(
                     go.Bar(
-                        x=enum_data.index,
-                        y=enum_data.values,
+                        x=enum_names,
+                        y=enum_counts,
                         marker_color=colors['info'],
-                        text=enum_data.values,
-                        textposition='outside'
+                        text=enum_counts,
+                        textposition='outside',
+                        _validate=False
                     ),
                     row=4, col=3
                 )
             
             # 10. GPS MAP
-            if lat_column in self.df.columns and lon_column in self.df.columns:
-                valid_gps = self.df.dropna(subset=[lat_column, lon_column])
-                if len(valid_gps) > 0:
-                    fig.add_trace(
+            if has_gps:
+                lat, lon = gps_lat, gps_lon
+                marker_size = 8 if lat.size <= 1000 else 6
+                hover_text = None
+                if lat.size > MAP_BIN_THRESHOLD:
+                    # Spatial binning: interviews sharing a cell become one bubble sized by count
+                    cells, cell_counts = np.unique(
+                        np.column_stack([np.round(lat, 3), np.round(lon, 3)]), axis=0, return_counts=True
+                    )
+                    lat, lon = cells[:, 0], cells[:, 1]
+                    marker_size = np.clip(5 + 2 * np.log2(cell_counts), 5, 20)
+                    hover_text = np.char.add(cell_counts.astype(str), ' interviews')
+                if lat.size > self.map_max_points:
+                    sample = np.sort(np.random.default_rng(0).choice(lat.size, self.map_max_points, replace=False))
+                    lat, lon = lat[sample], lon[sample]
+                    if hover_text is not None:
+                        marker_size, hover_text = marker_size[sample], hover_text[sample]
+                if lat.size > 0:
+                    # 5 decimals is ~1 m on the ground and shortens every number in the JSON
+                    add_trace(
                         go.Scattermapbox(
-                            lat=valid_gps[lat_column],
-                            lon=valid_gps[lon_column],
+                            lat=np.round(lat, 5),
+                            lon=np.round(lon, 5),
                             mode='markers',
-                            marker=dict(size=8, color='#ff6b6b', opacity=0.7),
-                            name='Interviews'
+                            marker=dict(size=marker_size, color='#ff6b6b', opacity=0.7),
+                            text=hover_text,
+                            name='Interviews',
+                            _validate=False
                         ),
                         row=5, col=1
                     )
             
             # 11. DAILY TRENDS
-            if '_submission_time' in self.df.columns:
-                daily_data = self.df.groupby(self.df['_submission_time'].dt.date).size()
-                fig.add_trace(
+            if has_submission_time:
+                # floor('D') keeps datetime64 keys instead of a Python date per row
+                daily_data = self.df['_submission_time'].dt.floor('D').value_counts().sort_index()
+                add_trace(
                     go.Scatter(
                         x=daily_data.index,
                         y=daily_data.values,
                         mode='lines+markers',
                         line=dict(color=colors['primary'], width=2),
-                        fill='tozeroy'
+                        fill='tozeroy',
+                        _validate=False
                     ),
                     row=6, col=1
                 )
             
             # 12. VALIDITY STATUS
-            if 'is_valid' in self.df.columns:
-                valid = self.df['is_valid'].sum()
-                invalid = (~self.df['is_valid']).sum()
-                too_long = self.df['is_too_long'].sum()
+            if self._is_valid is not None:
+                valid = self._n_valid
+                invalid = n_rows - self._n_valid
+                too_long = self._n_too_long
                 
-                fig.add_trace(
+                add_trace(
                     go.Bar(
                         x=['✅ Valid', '❌ Invalid', '⚠️ Too Long'],
                         y=[valid, invalid, too_long],
                         marker=dict(color=[colors['success'], colors['danger'], colors['warning']]),
                         text=[valid, invalid, too_long],
-                        textposition='outside'
+                        textposition='outside',
+                        _validate=False
                     ),
                     row=6, col=3
                 )
             
             # 13. PEAK HOURS
             if hourly_counts is not None:
-                fig.add_trace(
+                add_trace(
                     go.Bar(
                         x=hourly_counts.index,
                         y=hourly_counts.values,
                         marker_color=colors['info'],
                         text=hourly_counts.values,
-                        textposition='outside'
+                        textposition='outside',
+                        _validate=False
                     ),
                     row=7, col=1
                 )
             
             # 14. TIME ANALYSIS
             if time_stats:
-                fig.add_trace(
+                add_trace(
                     go.Table(
                         header=dict(
                             values=list(time_stats.keys()),
@@ -830,14 +1374,15 @@ class ONAQualityDashboard:
                             fill_color='#f0f4f8',
                             font=dict(color='#333', size=10),
                             align='center'
-                        )
+                        ),
+                        _validate=False
                     ),
                     row=7, col=2
                 )
             
             # 15. BENEFICIARY BALANCE
             if beneficiary_balance:
-                fig.add_trace(
+                add_trace(
                     go.Table(
                         header=dict(
                             values=list(beneficiary_balance.keys()),
@@ -850,14 +1395,15 @@ class ONAQualityDashboard:
                             fill_color='#f0f4f8',
                             font=dict(color='#333', size=10),
                             align='center'
-                        )
+                        ),
+                        _validate=False
                     ),
                     row=7, col=3
                 )
             
             # 16. BENEFICIARY PIVOT
             beneficiary_pivot = self._create_beneficiary_pivot_table()
-            fig.add_trace(
+            add_trace(
                 go.Table(
                     header=dict(
                         values=list(beneficiary_pivot.keys()),
@@ -870,32 +1416,37 @@ class ONAQualityDashboard:
                         fill_color='#f0f4f8',
                         font=dict(color='#333', size=11),
                         align='center'
-                    )
+                    ),
+                    _validate=False
                 ),
                 row=8, col=1
             )
             
             # 17. MISSING DATA
-            missing_data = (self.df.isnull().sum() / len(self.df) * 100).sort_values(ascending=False).head(8)
-            missing_data = missing_data[missing_data > 0]
-            
-            if len(missing_data) > 0:
+            # Percentages from the cached per-column null counts; nlargest selects
+            # the top 8 without sorting every column
+            null_counts = self._column_null_counts()
+            if null_counts.any():
+                missing_pct = null_counts / n_rows * 100
+                missing_data = missing_pct[missing_pct > 0].nlargest(8)
+                
                 display_names = [col.split('/')[-1] if '/' in col else col for col in missing_data.index]
-                fig.add_trace(
+                add_trace(
                     go.Bar(
                         y=display_names,
                         x=missing_data.values,
                         orientation='h',
                         marker_color=colors['danger'],
-                        text=[f'{v:.1f}%' for v in missing_data.values],
-                        textposition='outside'
+                        text=np.char.add(np.char.mod('%.1f', missing_data.values), '%'),
+                        textposition='outside',
+                        _validate=False
                     ),
-                    row=8, col=3
+                    row=5, col=3
                 )
             
             # 18. NEEDS SUPPORT
             if needs_support:
-                fig.add_trace(
+                add_trace(
                     go.Table(
                         header=dict(
                             values=list(needs_support.keys()),
@@ -908,14 +1459,21 @@ class ONAQualityDashboard:
                             fill_color='#fff9c4',
                             font=dict(color='#333', size=10),
                             align='center'
-                        )
+                        ),
+                        _validate=False
                     ),
                     row=8, col=3
                 )
             
             # 19. COMPLETION STATS
-            completion_data = self._calculate_completion_stats(district_column, duration_column, enumerator_column)
-            fig.add_trace(
+            # The daily trend is sorted by day, so its ends give the period without rescanning
+            date_range = None
+            if has_submission_time and len(daily_data) > 0:
+                date_range = (daily_data.index[0], daily_data.index[-1])
+            completion_data = self._calculate_completion_stats(
+                district_column, duration_column, enumerator_column, district_counts, date_range
+            )
+            add_trace(
                 go.Table(
                     header=dict(
                         values=['<b>Metric</b>', '<b>Value</b>'],
@@ -931,14 +1489,15 @@ class ONAQualityDashboard:
                         fill_color=[['#f0f4f8', '#ffffff'] * len(completion_data)],
                         font=dict(color='#333', size=11),
                         align='left'
-                    )
+                    ),
+                    _validate=False
                 ),
                 row=9, col=1
             )
             
             # 20. OVERALL QUALITY GAUGE
             quality_score = self._calculate_quality_score(duration_column, min_duration_threshold)
-            fig.add_trace(
+            add_trace(
                 go.Indicator(
                     mode="gauge+number+delta",
                     value=quality_score,
@@ -953,19 +1512,20 @@ class ONAQualityDashboard:
                             {'range': [75, 100], 'color': '#e8f5e9'}
                         ],
                         'threshold': {'line': {'color': "red", 'width': 4}, 'value': 90}
-                    }
+                    },
+                    _validate=False
                 ),
                 row=9, col=3
             )
             
             # 21. DETAILED ENUMERATOR PERFORMANCE
-            if enumerator_column and enumerator_column in self.df.columns:
+            if has_enumerator:
                 enum_performance = self._calculate_enumerator_performance_detailed(
                     enumerator_column, duration_column, district_column,
                     lat_column, lon_column, min_duration_threshold, max_duration_threshold
                 )
                 
-                fig.add_trace(
+                add_trace(
                     go.Table(
                         header=dict(
                             values=list(enum_performance.keys()),
@@ -978,11 +1538,22 @@ class ONAQualityDashboard:
                             fill_color='#fff3f3',
                             font=dict(color='#333', size=10),
                             align='center'
-                        )
+                        ),
+                        _validate=False
                     ),
                     row=10, col=1
                 )
             
+            if queued_traces:
+                traces, rows, cols = zip(*queued_traces)
+                fig.add_traces(list(traces), rows=list(rows), cols=list(cols))
+            
+            # The box plot is known to be there; plotly's empty-subplot check fails on
+            # figures holding Table traces, so it is skipped
+            if has_duration:
+                fig.add_hline(y=min_duration_threshold, line_dash="solid", line_color="red", line_width=2,
+                              row=4, col=2, exclude_empty_subplots=False)
+            
             # Update layout
             fig.update_layout(
                 height=3500,
@@ -1000,8 +1571,8 @@ class ONAQualityDashboard:
                 mapbox=dict(
                     style="open-street-map",
                     center=dict(
-                        lat=self.df[lat_column].mean() if lat_column in self.df.columns else 0,
-                        lon=self.df[lon_column].mean() if lon_column in self.df.columns else 0
+                        lat=float(gps_lat.mean(dtype=np.float64)) if self._n_gps else 0,
+                        lon=float(gps_lon.mean(dtype=np.float64)) if self._n_gps else 0
                     ),
                     zoom=6
                 )
@@ -1012,14 +1583,14 @@ class ONAQualityDashboard:
             fig.update_yaxes(showgrid=True, gridcolor='#e0e0e0')
             
             # Save dashboard
-            fig.write_html(output_file)
-            logger.info(f"✅ Enhanced dashboard successfully saved to {output_file}")
+            _write_dashboard_html(fig, output_file)
+            self._last_signature = signature
+            self._last_generated = now
+            logger.info("✅ Enhanced dashboard successfully saved to %s", output_file)
             return True
             
         except Exception as e:
-            logger.error(f"Error generating dashboard: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception("Error generating dashboard: %s", e)
             return False
     
     def _calculate_enumerator_performance_detailed(self, enum_col, duration_col, district_col, 
@@ -1036,95 +1607,127 @@ class ONAQualityDashboard:
             'Invalid %': []
         }
         
-        enumerators = self.df[enum_col].value_counts().index
-        
-        for enum in enumerators:
-            enum_data = self.df[self.df[enum_col] == enum]
-            
-            total = len(enum_data)
-            too_short = enum_data['is_too_short'].sum() if 'is_too_short' in enum_data.columns else 0
-            too_long = enum_data['is_too_long'].sum() if 'is_too_long' in enum_data.columns else 0
-            avg_dur = enum_data[duration_col].mean()
-            invalid_pct = (too_short / total * 100) if total > 0 else 0
-            
-            if district_col and district_col in enum_data.columns:
-                districts = enum_data[district_col].value_counts().to_dict()
-                district_str = ', '.join([f"{dist}({cnt})" for dist, cnt in districts.items()])
+        max_rows = 15
+        keys = self.df[enum_col]
+        n_rows = len(self.df)
+        
+        # Every per-enumerator number in one grouped pass
+        flags = pd.DataFrame({
+            'duration': self.df[duration_col].to_numpy(dtype=float, na_value=np.nan),
+            'too_short': self._is_too_short if self._is_too_short is not None else np.zeros(n_rows, dtype=bool),
+            'too_long': self._is_too_long if self._is_too_long is not None else np.zeros(n_rows, dtype=bool)
+        }, index=self.df.index)
+        stats = flags.groupby(keys, sort=False, observed=True).agg(
+            total=('duration', 'size'),
+            too_short=('too_short', 'sum'),
+            too_long=('too_long', 'sum'),
+            avg_dur=('duration', 'mean')
+        )
+        
+        # Busiest first, then most too-short interviews (stable, so ties stay busiest first);
+        # only the rows shown get their text columns built
+        order = keys.value_counts()
+        stats = stats.reindex(order.index[order.to_numpy() > 0])
+        stats = stats.sort_values('too_short', ascending=False, kind='stable').head(max_rows)
+        shown = keys.isin(stats.index).to_numpy()
+        
+        district_strs = None
+        if district_col and district_col in self.df.columns:
+            pair_counts = self.df.loc[shown, [enum_col, district_col]].groupby(
+                [enum_col, district_col], sort=False, observed=True
+            ).size().sort_values(ascending=False, kind='stable')
+            labels = np.char.add(
+                np.char.add(pair_counts.index.get_level_values(1).astype(str).to_numpy(dtype=str), '('),
+                np.char.add(pair_counts.to_numpy().astype(str), ')')
+            )
+            district_strs = pd.Series(labels, index=pair_counts.index.get_level_values(0)).groupby(
+                level=0, sort=False, observed=True
+            ).agg(', '.join)
+        
+        # GPS examples for the shown enumerators: the first two fixes each,
+        # formatted as vectorized strings rather than row by row
+        has_gps = lat_col in self.df.columns and lon_col in self.df.columns
+        if has_gps:
+            gps = self.df.loc[shown, [enum_col, lat_col, lon_col]].dropna(subset=[lat_col, lon_col])
+            gps_counts = gps.groupby(enum_col, sort=False, observed=True).size()
+            examples = gps.groupby(enum_col, sort=False, observed=True).head(2)
+            lat_str = np.char.mod('%.4f', examples[lat_col].to_numpy(dtype=float))
+            lon_str = np.char.mod('%.4f', examples[lon_col].to_numpy(dtype=float))
+            coords = np.char.add(np.char.add(np.char.add(np.char.add('(', lat_str), ','), lon_str), ')')
+            gps_examples = pd.Series(coords, index=examples[enum_col].to_numpy()).groupby(
+                level=0, sort=False
+            ).agg(', '.join)
+        
+        for enum, row in zip(stats.index, stats.itertuples(index=False)):
+            if district_strs is not None:
+                district_str = district_strs.get(enum, '')
             else:
                 district_str = 'N/A'
             
-            if lat_col in enum_data.columns and lon_col in enum_data.columns:
-                gps_data = enum_data[[lat_col, lon_col]].dropna()
-                if len(gps_data) > 0:
-                    gps_examples = []
-                    for idx, row in gps_data.head(2).iterrows():
-                        gps_examples.append(f"({row[lat_col]:.4f},{row[lon_col]:.4f})")
-                    gps_str = ', '.join(gps_examples)
-                    if len(gps_data) > 2:
-                        gps_str += f' +{len(gps_data)-2} more'
+            if has_gps:
+                n_gps = gps_counts.get(enum, 0)
+                if n_gps > 0:
+                    gps_str = gps_examples[enum]
+                    if n_gps > 2:
+                        gps_str += f' +{n_gps-2} more'
                 else:
                     gps_str = 'No GPS'
             else:
                 gps_str = 'N/A'
             
             performance['Enumerator'].append(str(enum))
-            performance['Total'].append(total)
-            performance['❌ Too Short'].append(too_short)
-            performance['⚠️ Too Long'].append(too_long)
+            performance['Total'].append(int(row.total))
+            performance['❌ Too Short'].append(int(row.too_short))
+            performance['⚠️ Too Long'].append(int(row.too_long))
             performance['Districts'].append(district_str)
             performance['GPS Coords'].append(gps_str)
-            performance['Avg Duration'].append(f"{avg_dur:.0f}min")
-            performance['Invalid %'].append(f"{invalid_pct:.1f}%")
-        
-        sorted_indices = sorted(range(len(performance['❌ Too Short'])), 
-                               key=lambda i: performance['❌ Too Short'][i], 
-                               reverse=True)
-        
-        for key in performance:
-            performance[key] = [performance[key][i] for i in sorted_indices]
-        
-        max_rows = 15
-        for key in performance:
-            performance[key] = performance[key][:max_rows]
+            performance['Avg Duration'].append(f"{row.avg_dur:.0f}min")
+            performance['Invalid %'].append(f"{row.too_short / row.total * 100:.1f}%")
         
         return performance
     
-    def _calculate_completion_stats(self, district_col, duration_col, enum_col):
-        """Calculate completion statistics"""
+    def _calculate_completion_stats(self, district_col, duration_col, enum_col, district_counts=None,
+                                    date_range=None):
+        """Calculate completion statistics; date_range is an optional precomputed (first, last) submission"""
         stats = {}
+        n_rows = len(self.df)
+        columns = self.df.columns
         
-        stats['📊 Total Surveys'] = f"{len(self.df):,}"
+        stats['📊 Total Surveys'] = f"{n_rows:,}"
         
-        if 'is_valid' in self.df.columns:
-            valid_count = self.df['is_valid'].sum()
-            invalid_count = (~self.df['is_valid']).sum()
-            valid_pct = (valid_count / len(self.df) * 100)
+        if self._is_valid is not None:
+            valid_count = self._n_valid
+            invalid_count = n_rows - self._n_valid
+            valid_pct = (valid_count / n_rows * 100)
             stats['✅ Valid (≥50min)'] = f"{valid_count} ({valid_pct:.1f}%)"
             stats['❌ Invalid (<50min)'] = f"{invalid_count} ({100-valid_pct:.1f}%)"
         
-        if district_col and district_col in self.df.columns:
-            n_districts = self.df[district_col].nunique()
+        if district_col and district_col in columns:
+            n_districts = len(district_counts) if district_counts is not None else self.df[district_col].nunique()
             stats['📍 Districts'] = f"{n_districts}"
         
-        if enum_col and enum_col in self.df.columns:
+        if enum_col and enum_col in columns:
             n_enums = self.df[enum_col].nunique()
             stats['👥 Enumerators'] = f"{n_enums}"
         
-        if duration_col and duration_col in self.df.columns:
+        if duration_col and duration_col in columns:
             avg_duration = self.df[duration_col].mean()
             stats['⏱️ Avg Duration'] = f"{avg_duration:.1f} min"
         
-        if 'latitude' in self.df.columns and 'longitude' in self.df.columns:
-            valid_gps = self.df[['latitude', 'longitude']].notna().all(axis=1).sum()
-            gps_pct = (valid_gps / len(self.df) * 100)
+        valid_gps = self._gps_count()
+        if valid_gps is not None:
+            gps_pct = (valid_gps / n_rows * 100)
             stats['📍 Valid GPS'] = f"{gps_pct:.1f}%"
         
-        completeness = (1 - self.df.isnull().sum().sum() / (len(self.df) * len(self.df.columns))) * 100
+        completeness = self._completeness()
         stats['✅ Data Complete'] = f"{completeness:.1f}%"
         
-        if '_submission_time' in self.df.columns:
-            date_range = f"{self.df['_submission_time'].min().strftime('%b %d')} - {self.df['_submission_time'].max().strftime('%b %d')}"
-            stats['📅 Period'] = date_range
+        if '_submission_time' in columns:
+            if date_range is None:
+                submission_time = self.df['_submission_time']
+                date_range = (submission_time.min(), submission_time.max())
+            first, last = date_range
+            stats['📅 Period'] = f"{first.strftime('%b %d')} - {last.strftime('%b %d')}"
         
         return stats
     
@@ -1133,17 +1736,29 @@ class ONAQualityDashboard:
         if self.df is None or len(self.df) == 0:
             return 0
         
+        gps_count = self._gps_count()
+        
+        null_counts = self._column_null_counts()
+        n_cells = len(self.df) * len(null_counts)
+        return self._quality_score_from_counts(
+            len(self.df), n_cells, n_cells - null_counts.sum(), gps_count,
+            self._n_valid if self._is_valid is not None else None
+        )
+    
+    @staticmethod
+    def _quality_score_from_counts(n_rows, n_cells, n_non_null, gps_count, valid_count):
+        """Weighted quality score; gps_count/valid_count are None when the columns are absent"""
         scores = []
         
-        completeness = (1 - self.df.isnull().sum().sum() / (len(self.df) * len(self.df.columns))) * 100
+        completeness = (n_non_null / n_cells) * 100
         scores.append(completeness * 0.30)
         
-        if 'latitude' in self.df.columns and 'longitude' in self.df.columns:
-            gps_valid = (self.df[['latitude', 'longitude']].notna().all(axis=1).sum() / len(self.df)) * 100
+        if gps_count is not None:
+            gps_valid = (gps_count / n_rows) * 100
             scores.append(gps_valid * 0.25)
         
-        if 'is_valid' in self.df.columns:
-            valid_interviews = (self.df['is_valid'].sum() / len(self.df)) * 100
+        if valid_count is not None:
+            valid_interviews = (valid_count / n_rows) * 100
             scores.append(valid_interviews * 0.45)
         
         return round(sum(scores), 1)
@@ -7,11 +7,106 @@ import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
+import plotly.io as pio
+from plotly.offline import get_plotlyjs_version
 import numpy as np
+from pandas.api.types import is_datetime64_any_dtype
+import pyarrow.types as pa_types
 from datetime import datetime, timedelta
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import os
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import polars as pl
+except ImportError:  # fall back to the pandas CSV reader
+    pl = None
+
+try:
+    import xlsxwriter
+except ImportError:  # fall back to openpyxl for the Excel report
+    xlsxwriter = None
+
+try:
+    import numba
+except ImportError:  # GPS checks use the numpy path
+    numba = None
+
+try:
+    import orjson  # noqa: F401
+except ImportError:  # Plotly keeps its stdlib JSON encoder
+    orjson = None
+else:
+    # Serialize figures with orjson (native numpy arrays) rather than the stdlib encoder
+    pio.json.config.default_engine = 'orjson'
+
+# pandas' default NA markers, so the Polars reader flags the same missing answers
+CSV_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+    '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+
+# Upper bound on points drawn on the GPS map; larger datasets are sampled
+MAX_MAP_POINTS = 10_000
+
+# Row count above which the compiled GPS kernel is used (when numba is installed)
+NUMBA_GPS_MIN_ROWS = 1_000_000
+
+# Columns identifying a submission, carried into the duration/GPS issue tables
+# (the district column, which callers name, goes after respondent_name)
+REPORT_ID_COLUMNS = ('_id', 'respondent_id', 'respondent_name', 'submission_time')
+
+# Labels indexed by the issue code assigned in verify_gps_coordinates (0 = no issue)
+GPS_ISSUE_LABELS = np.array(
+    [None, 'Missing GPS coordinates', 'Invalid GPS coordinates', 'Outside target boundaries'],
+    dtype=object
+)
+
+# Static page the figure JSON is dropped into; plotly.js is loaded from the CDN
+DASHBOARD_HTML_TEMPLATE = """<html>
+<head><meta charset="utf-8" /></head>
+<body>
+    <div id="dashboard" style="height:100%; width:100%;"></div>
+    <script src="https://cdn.plot.ly/plotly-{plotlyjs_version}.min.js" charset="utf-8"></script>
+    <script type="text/javascript">
+        var figure = {figure_json};
+        Plotly.newPlot('dashboard', figure.data, figure.layout, {{"responsive": true}});
+    </script>
+</body>
+</html>
+"""
+
+
+def _write_dashboard_html(fig, output_file):
+    """Write the figure into the static page, skipping plotly.js inlining and re-validation"""
+    # Escape '</' so text in the data cannot close the script tag
+    figure_json = pio.to_json(fig, validate=False).replace('</', '<\\/')
+    html = DASHBOARD_HTML_TEMPLATE.format(
+        plotlyjs_version=get_plotlyjs_version(), figure_json=figure_json
+    )
+    with open(output_file, 'wb') as f:
+        f.write(html.encode('utf-8'))
+
+
+if numba is not None:
+    # fastmath is left off on purpose: it lets LLVM assume NaN never occurs,
+    # which would compile away the missing-coordinate check
+    @numba.njit(parallel=True, cache=True)
+    def _classify_gps(lat, lon, lat_min, lat_max, lon_min, lon_max, out):
+        """Write the GPS issue code for every row in a single pass over lat/lon"""
+        for i in numba.prange(lat.shape[0]):
+            if np.isnan(lat[i]) or np.isnan(lon[i]):
+                out[i] = 1
+            elif abs(lat[i]) > 90 or abs(lon[i]) > 180:
+                out[i] = 2
+            elif lat[i] < lat_min or lat[i] > lat_max or lon[i] < lon_min or lon[i] > lon_max:
+                out[i] = 3
+            else:
+                out[i] = 0
+
 class ONAQualityDashboard:
     """
     Automated dashboard for monitoring data quality metrics from ONA platform
@@ -28,8 +123,16 @@ class ONAQualityDashboard:
         config : dict
             Configuration dictionary with thresholds and settings
         """
-        self.data = pd.read_csv(data_path)
+        self._configure(data_path, config)
         
+        self.data = self._read_parquet_cache(('data',))
+        if self.data is None:
+            self.data = self._load_data(data_path)
+            self._prepare_data()
+            self._write_parquet_cache(('data',), self.data)
+    
+    def _configure(self, data_path, config):
+        """Set up configuration and caches shared by every way of loading data"""
         # Default configuration (can be updated after pilot)
         self.config = config or {
             'min_duration': 30,  # minutes
@@ -38,31 +141,369 @@ class ONAQualityDashboard:
             'gps_tolerance': 0.01,  # GPS coordinate tolerance in degrees (~1km)
             'target_boundaries': None,  # Dict with 'lat_min', 'lat_max', 'lon_min', 'lon_max'
             'required_fields': [],  # List of required field names
-            'logical_checks': []  # List of logical consistency rules
+            'logical_checks': [],  # List of logical consistency rules
+            'cache_dir': None  # Parquet cache location, None to disable
         }
         
         if config:
             self.config.update(config)
         
-        self._prepare_data()
+        # Memoized metric frames, keyed on (metric, arguments, relevant config)
+        self._cache = {}
+        
+        # On-disk cache entries are tied to this exact version of the export
+        self._cache_dir = self.config.get('cache_dir')
+        self._source_key = (
+            os.path.abspath(data_path), os.path.getmtime(data_path), os.path.getsize(data_path)
+        )
+    
+    @classmethod
+    def from_large_csv(cls, data_path, config=None, chunksize=500_000,
+                       district_column='district',
+                       duration_column='duration_minutes',
+                       lat_column='latitude',
+                       lon_column='longitude'):
+        """
+        Build a dashboard from a CSV too large to hold in memory
+        
+        The export is read in chunks and only the aggregates the dashboard and
+        quality report need are kept: completion counts per district, missing
+        counts per field, daily submission counts, the flagged rows, duration
+        histogram counts (a first pass over the duration columns fixes the bin
+        edges) and a sample of GPS points for the map. The returned dashboard's ``data`` is an empty frame
+        with the export's columns; generate_dashboard and export_quality_report
+        must be called with the same column names passed here.
+        
+        Parameters:
+        -----------
+        data_path : str
+            Path to the ONA exported data (CSV format)
+        config : dict
+            Configuration dictionary with thresholds and settings
+        chunksize : int
+            Number of rows read per chunk
+        district_column, duration_column, lat_column, lon_column : str
+            Column names the aggregates are computed for
+        
+        Returns:
+        --------
+        ONAQualityDashboard
+        """
+        dashboard = cls.__new__(cls)
+        dashboard._configure(data_path, config)
+        
+        n_rows = 0
+        completion_parts, flag_parts, gps_parts = [], [], []
+        missing_counts = None
+        daily_counts = None
+        period = None
+        gps_sum = np.zeros(2)
+        gps_count = np.zeros(2)
+        map_points = None
+        rng = np.random.default_rng(0)
+        duration_range = cls._chunked_duration_range(data_path, chunksize, duration_column)
+        histogram_counts = histogram_edges = None
+        
+        # The pyarrow engine cannot stream, so chunks come from the C parser
+        reader = pd.read_csv(
+            data_path,
+            chunksize=chunksize,
+            dtype_backend='pyarrow',
+            parse_dates=cls._csv_date_columns(data_path)
+        )
+        for chunk in reader:
+            part = cls.__new__(cls)
+            part.config = dashboard.config
+            part._cache = {}
+            part._cache_dir = None
+            part.data = chunk
+            part._prepare_data()
+            data = part.data
+            
+            n_rows += len(data)
+            
+            completion = part.calculate_completion_rates(district_column)
+            if not completion.empty:
+                completion_parts.append(completion[[district_column, 'completed', 'total']])
+            
+            chunk_missing = pd.Series(len(data) - data.count().values, index=data.columns)
+            missing_counts = chunk_missing if missing_counts is None else missing_counts.add(chunk_missing, fill_value=0)
+            
+            flag_parts.append(part.flag_interview_durations(duration_column, district_column))
+            
+            issues = part.verify_gps_coordinates(lat_column, lon_column, district_column)
+            if not issues.empty:
+                gps_parts.append(issues)
+            
+            if duration_range is not None and duration_column in data.columns:
+                # Same edges for every chunk, so the per-chunk counts simply add up
+                chunk_counts, histogram_edges = np.histogram(
+                    data[duration_column].dropna().to_numpy(dtype=np.float32), bins=30, range=duration_range
+                )
+                histogram_counts = chunk_counts if histogram_counts is None else histogram_counts + chunk_counts
+            
+            date_col = part._date_column()
+            if date_col is not None:
+                chunk_daily = data.groupby(data[date_col].dt.floor('D')).size()
+                daily_counts = chunk_daily if daily_counts is None else daily_counts.add(chunk_daily, fill_value=0)
+            
+            if 'submission_time' in data.columns and data['submission_time'].notna().any():
+                chunk_period = (data['submission_time'].min(), data['submission_time'].max())
+                period = chunk_period if period is None else (
+                    min(period[0], chunk_period[0]), max(period[1], chunk_period[1])
+                )
+            
+            if lat_column in data.columns and lon_column in data.columns:
+                coords = data[[lat_column, lon_column]]
+                gps_sum += coords.sum().values
+                gps_count += coords.count().values
+                
+                # Bottom-k sampling: keep the points with the smallest random
+                # keys, which is a uniform sample over all chunks read so far
+                valid_gps = data[coords.notna().all(axis=1)]
+                valid_gps = valid_gps[[c for c in (lat_column, lon_column, district_column) if c in valid_gps.columns]]
+                valid_gps = valid_gps.assign(_sample_key=rng.random(len(valid_gps)))
+                if map_points is not None:
+                    valid_gps = pd.concat([map_points, valid_gps])
+                map_points = valid_gps.nsmallest(MAX_MAP_POINTS, '_sample_key')
+        
+        if not n_rows:
+            data = pd.read_csv(data_path, nrows=0)
+        dashboard.data = data.iloc[:0]
+        cache = dashboard._cache
+        cache['submission_count'] = n_rows
+        
+        # Store the results under the keys the metric methods look up
+        if completion_parts:
+            completion = pd.concat(completion_parts).groupby(district_column, sort=False).sum()
+            completion['completion_rate'] = (completion['completed'] / completion['total'] * 100).round(2)
+            cache[('completion_rates', district_column, tuple(dashboard.config['required_fields']))] = \
+                completion.reset_index()
+        
+        if missing_counts is not None:
+            cache['missing_data'] = cls._missing_data_table(
+                missing_counts.index, missing_counts.values.astype(np.int64), n_rows
+            )
+        
+        min_dur = dashboard.config['min_duration']
+        max_dur = dashboard.config['max_duration']
+        cache[('duration_flags', duration_column, district_column, min_dur, max_dur)] = (
+            pd.concat(flag_parts) if flag_parts else pd.DataFrame()
+        )
+        
+        bounds = dashboard.config['target_boundaries']
+        if gps_parts:
+            issues = pd.concat(gps_parts, ignore_index=True)
+            issue_order = pd.Categorical(issues['gps_issue'], categories=GPS_ISSUE_LABELS[1:])
+            issues = issues.iloc[np.argsort(issue_order.codes, kind='stable')].reset_index(drop=True)
+        else:
+            issues = pd.DataFrame()
+        cache[('gps_issues', lat_column, lon_column, district_column,
+               tuple(sorted(bounds.items())) if bounds else None)] = issues
+        
+        if histogram_counts is not None:
+            cache[('duration_histogram', duration_column)] = (histogram_counts, histogram_edges)
+        if daily_counts is not None:
+            daily_counts = daily_counts.astype(np.int64)
+            daily_counts.index = pd.DatetimeIndex(daily_counts.index)
+        cache['daily_counts'] = daily_counts
+        cache['collection_period'] = period
+        if map_points is not None:
+            cache[('map_points', lat_column, lon_column)] = \
+                map_points.sort_index().drop(columns='_sample_key')
+            cache[('map_center', lat_column, lon_column)] = tuple(gps_sum / np.maximum(gps_count, 1))
+        
+        return dashboard
+    
+    @classmethod
+    def _chunked_duration_range(cls, data_path, chunksize, duration_column):
+        """
+        (min, max) float32 duration over the whole export, or None without
+        durations; only the columns durations come from are read
+        """
+        header = pd.read_csv(data_path, nrows=0).columns
+        source_columns = [col for col in (duration_column, 'start_time', 'end_time') if col in header]
+        if not source_columns:
+            return None
+        
+        low = high = None
+        reader = pd.read_csv(
+            data_path,
+            usecols=source_columns,
+            chunksize=chunksize,
+            dtype_backend='pyarrow',
+            parse_dates=[col for col in cls._csv_date_columns(data_path) if col in source_columns]
+        )
+        for chunk in reader:
+            part = cls.__new__(cls)
+            part.data = chunk
+            part._prepare_data()
+            if duration_column not in part.data.columns:
+                return None
+            
+            durations = part.data[duration_column].dropna().to_numpy(dtype=np.float32)
+            if durations.size:
+                low = durations.min() if low is None else min(low, durations.min())
+                high = durations.max() if high is None else max(high, durations.max())
+        
+        return None if low is None else (low, high)
+    
+    def _parquet_cache_prefix(self):
+        """File name prefix shared by every cache entry of this export's path"""
+        return hashlib.sha1(repr(self._source_key[0]).encode()).hexdigest()[:12] + '-'
+    
+    def _parquet_cache_version(self):
+        """File name prefix of the cache entries for this exact version (mtime, size) of the export"""
+        version = hashlib.sha1(repr(self._source_key).encode()).hexdigest()[:12]
+        return f"{self._parquet_cache_prefix()}{version}-"
+    
+    def _parquet_cache_path(self, key):
+        """Cache file for a given key under the configured cache directory"""
+        digest = hashlib.sha1(repr((self._source_key, key)).encode()).hexdigest()[:20]
+        return Path(self._cache_dir).expanduser() / f"{self._parquet_cache_version()}{digest}.parquet"
+    
+    def _evict_stale_cache(self, cache_dir):
+        """Delete entries left by earlier versions of this export, which can never be read again"""
+        current = self._parquet_cache_version()
+        for path in cache_dir.glob(f"{self._parquet_cache_prefix()}*.parquet"):
+            if not path.name.startswith(current):
+                try:
+                    path.unlink()
+                except OSError as e:
+                    print(f"Warning: could not remove stale cache file {path}: {str(e)}")
+    
+    def _read_parquet_cache(self, key):
+        """Return a frame persisted by an earlier run on the same export, or None"""
+        if not self._cache_dir:
+            return None
+        
+        path = self._parquet_cache_path(key)
+        if not path.exists():
+            return None
+        
+        try:
+            return pd.read_parquet(path)
+        except Exception as e:
+            print(f"Warning: ignoring unreadable cache file {path}: {str(e)}")
+            return None
+    
+    def _write_parquet_cache(self, key, frame):
+        """Persist a frame so later runs on the same export can skip recomputing it"""
+        if not self._cache_dir:
+            return
+        
+        path = self._parquet_cache_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._evict_stale_cache(path.parent)
+            frame.to_parquet(path, compression='zstd')
+        except Exception as e:
+            print(f"Warning: could not write cache file {path}: {str(e)}")
+    
+    def _load_data(self, data_path):
+        """
+        Read the ONA export into a pandas DataFrame
+        
+        Uses Polars' multithreaded lazy CSV scan (with date parsing done by the
+        reader) when Polars is installed, otherwise the pandas reader; the pandas
+        reader is also used for files Polars cannot parse (e.g. a column whose
+        type changes after the inferred rows). Either way time/date columns are
+        parsed while reading rather than in a second pass.
+        """
+        if pl is not None:
+            lazy_frame = pl.scan_csv(
+                data_path,
+                try_parse_dates=True,
+                infer_schema_length=10_000,
+                null_values=CSV_NA_VALUES
+            )
+            try:
+                data = lazy_frame.collect().to_pandas(use_pyarrow_extension_array=True)
+                return self._restore_utc_offsets(data, data_path)
+            except pl.exceptions.PolarsError as e:
+                print(f"Warning: Polars could not parse {data_path} ({str(e).splitlines()[0]}), using the pandas reader")
+        
+        parse_dates = self._csv_date_columns(data_path)
+        try:
+            data = pd.read_csv(
+                data_path,
+                engine='pyarrow',
+                dtype_backend='pyarrow',
+                parse_dates=parse_dates
+            )
+        except ValueError as e:
+            # pyarrow also infers column types from the first block only
+            print(f"Warning: pyarrow could not parse {data_path} ({str(e).splitlines()[0]}), using the C parser")
+            return pd.read_csv(data_path, parse_dates=parse_dates)
+        return self._restore_utc_offsets(data, data_path)
+    
+    @staticmethod
+    def _restore_utc_offsets(data, data_path):
+        """
+        Put timestamps the Arrow-based readers normalised to UTC back on the
+        export's own UTC offset, so days are bucketed on local wall time
+        """
+        def timezone(dtype):
+            # Arrow-backed timestamps keep the zone on the pyarrow type
+            return getattr(getattr(dtype, 'pyarrow_dtype', dtype), 'tz', None)
+        
+        utc_columns = [col for col in data.columns if str(timezone(data[col].dtype)) == 'UTC']
+        if not utc_columns:
+            return data
+        
+        # The first recorded value of each column carries the offset it was exported with
+        raw = pd.read_csv(data_path, usecols=utc_columns, dtype=str, nrows=1_000)
+        for col in utc_columns:
+            first = raw[col].dropna()
+            if not first.empty:
+                data[col] = data[col].dt.tz_convert(pd.Timestamp(first.iloc[0]).tz)
+        return data
+    
+    @staticmethod
+    def _csv_date_columns(data_path):
+        """Peek at the CSV header so the parser converts time/date columns directly"""
+        header = pd.read_csv(data_path, nrows=0).columns
+        return [col for col in header if 'time' in col.lower() or 'date' in col.lower()]
     
     def _prepare_data(self):
         """Prepare and clean the data for analysis"""
-        # Convert submission time to datetime if exists
-        time_columns = [col for col in self.data.columns if 'time' in col.lower() or 'date' in col.lower()]
-        for col in time_columns:
-            try:
-                self.data[col] = pd.to_datetime(self.data[col])
-            except:
-                pass
+        # The readers parse ISO time/date columns themselves; convert the ones
+        # they left as text (e.g. "06 Jan 2026" or "01/06/2026 14:05")
+        for col in self.data.columns:
+            if ('time' in col.lower() or 'date' in col.lower()) and not self._is_datetime(self.data[col]):
+                parsed = pd.to_datetime(self.data[col], format='ISO8601', cache=True, errors='coerce')
+                if parsed.isna().sum() > self.data[col].isna().sum():
+                    # Some values are not ISO; infer them one by one instead
+                    parsed = pd.to_datetime(self.data[col], format='mixed', cache=True, errors='coerce')
+                self.data[col] = parsed
         
         # Calculate interview duration if start and end times exist
         if 'start_time' in self.data.columns and 'end_time' in self.data.columns:
-            self.data['duration_minutes'] = (
-                (pd.to_datetime(self.data['end_time']) - 
-                 pd.to_datetime(self.data['start_time']))
-                .dt.total_seconds() / 60
-            )
+            start_ns, start_missing = self._epoch_ns(self.data['start_time'])
+            end_ns, end_missing = self._epoch_ns(self.data['end_time'])
+            
+            duration = (end_ns - start_ns) / 6e10  # ns -> minutes
+            duration[start_missing | end_missing] = np.nan
+            self.data['duration_minutes'] = duration
+    
+    @staticmethod
+    def _is_datetime(values):
+        """True for numpy and Arrow-backed timestamp columns"""
+        arrow_type = getattr(values.dtype, 'pyarrow_dtype', None)
+        if arrow_type is not None:
+            return pa_types.is_timestamp(arrow_type)
+        return is_datetime64_any_dtype(values)
+    
+    @staticmethod
+    def _epoch_ns(timestamps):
+        """Return (int64 nanoseconds since epoch, NaT mask) for a timestamp column"""
+        if not is_datetime64_any_dtype(timestamps):
+            timestamps = pd.to_datetime(timestamps)
+        if timestamps.dt.tz is not None:
+            timestamps = timestamps.dt.tz_convert(None)
+        
+        values = timestamps.to_numpy(dtype='datetime64[ns]', na_value=np.datetime64('NaT'))
+        return values.view('i8'), np.isnat(values)
     
     def calculate_completion_rates(self, district_column='district'):
         """
@@ -82,27 +523,43 @@ class ONAQualityDashboard:
             print(f"Warning: '{district_column}' column not found")
             return pd.DataFrame()
         
-        # Calculate total submissions by district
-        district_counts = self.data[district_column].value_counts()
+        cache_key = ('completion_rates', district_column, tuple(self.config['required_fields']))
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+        
+        cached = self._read_parquet_cache(cache_key)
+        if cached is not None:
+            self._cache[cache_key] = cached
+            return cached
         
         # Calculate completed vs incomplete
         # Assuming a submission is complete if all required fields are filled
         if self.config['required_fields']:
-            self.data['is_complete'] = self.data[self.config['required_fields']].notna().all(axis=1)
+            # AND the per-field masks in place instead of building an N x K mask
+            is_complete = np.ones(len(self.data), dtype=np.bool_)
+            for field in self.config['required_fields']:
+                np.logical_and(is_complete, self.data[field].notna().values, out=is_complete)
         else:
             # If no required fields specified, check overall completeness
-            self.data['is_complete'] = self.data.notna().mean(axis=1) > 0.8
-        
-        completion_by_district = self.data.groupby(district_column).agg({
-            'is_complete': ['sum', 'count', 'mean']
-        }).round(4)
+            # (compare counts against the threshold, no per-row division)
+            is_complete = (self.data.count(axis=1) > 0.8 * self.data.shape[1]).values
         
-        completion_by_district.columns = ['completed', 'total', 'completion_rate']
+        # Group a standalone Series so self.data is never mutated here; the
+        # metrics are computed concurrently by generate_dashboard
+        is_complete = pd.Series(is_complete, index=self.data.index, name='is_complete')
+        completion_by_district = is_complete.groupby(
+            self.data[district_column], sort=False, observed=True
+        ).agg(
+            completed='sum',
+            total='size'
+        )
         completion_by_district['completion_rate'] = (
-            completion_by_district['completion_rate'] * 100
+            completion_by_district['completed'] / completion_by_district['total'] * 100
         ).round(2)
         
-        return completion_by_district.reset_index()
+        self._cache[cache_key] = completion_by_district.reset_index()
+        self._write_parquet_cache(cache_key, self._cache[cache_key])
+        return self._cache[cache_key]
     
     def analyze_missing_data(self):
         """
@@ -113,17 +570,34 @@ class ONAQualityDashboard:
         pd.DataFrame
             Missing data statistics by field
         """
+        if 'missing_data' in self._cache:
+            return self._cache['missing_data']
+        
+        cached = self._read_parquet_cache('missing_data')
+        if cached is not None:
+            self._cache['missing_data'] = cached
+            return cached
+        
+        # Per-column non-null counts, without building the full N x M null mask
+        missing_counts = len(self.data) - self.data.count().values
+        missing_data = self._missing_data_table(self.data.columns, missing_counts, len(self.data))
+        
+        self._cache['missing_data'] = missing_data
+        self._write_parquet_cache('missing_data', missing_data)
+        return missing_data
+    
+    @staticmethod
+    def _missing_data_table(fields, missing_counts, n_rows):
+        """Fields with at least one missing value, most incomplete first"""
         missing_data = pd.DataFrame({
-            'field': self.data.columns,
-            'missing_count': self.data.isna().sum().values,
-            'missing_percentage': (self.data.isna().sum().values / len(self.data) * 100).round(2)
+            'field': fields,
+            'missing_count': missing_counts,
+            'missing_percentage': (missing_counts / n_rows * 100).round(2)
         })
         
-        missing_data = missing_data[missing_data['missing_count'] > 0].sort_values(
+        return missing_data[missing_data['missing_count'] > 0].sort_values(
             'missing_percentage', ascending=False
         )
-        
-        return missing_data
     
     def check_logical_inconsistencies(self, rules=None):
         """
@@ -148,12 +622,38 @@ class ONAQualityDashboard:
             # Default logical checks
             rules = []
         
+        if rules and self.data.empty:
+            # Dashboards built by from_large_csv keep aggregates only, no rows to test
+            print("Warning: no rows in memory (from_large_csv keeps aggregates only), skipping logical checks")
+            return pd.DataFrame()
+        
         inconsistencies = []
         
-        for rule in rules:
+        # Evaluate all string conditions in one eval call, collecting the
+        # results in a dict target rather than a copy of the frame (eval
+        # fills and returns a copy of the target, not the dict passed in)
+        str_conditions = {
+            f"_r{i}": rule['condition'] for i, rule in enumerate(rules)
+            if not callable(rule['condition'])
+        }
+        batch_results = {}
+        if str_conditions:
+            try:
+                batch_results = self.data.eval(
+                    "\n".join(f"{name} = {cond}" for name, cond in str_conditions.items()),
+                    target={}
+                )
+            except Exception:
+                # One bad rule fails the batch; evaluate rule by rule below
+                # so the error is reported against the right rule
+                batch_results = {}
+        
+        for i, rule in enumerate(rules):
             try:
                 if callable(rule['condition']):
                     violations = rule['condition'](self.data)
+                elif f"_r{i}" in batch_results:
+                    violations = batch_results[f"_r{i}"]
                 else:
                     violations = self.data.eval(rule['condition'])
                 
@@ -162,14 +662,22 @@ class ONAQualityDashboard:
                 inconsistencies.append({
                     'rule': rule['name'],
                     'violations': violation_count,
-                    'percentage': (violation_count / len(self.data) * 100).round(2)
+                    'percentage': round(violation_count / len(self.data) * 100, 2)
                 })
             except Exception as e:
                 print(f"Error checking rule '{rule['name']}': {str(e)}")
         
         return pd.DataFrame(inconsistencies)
     
-    def flag_interview_durations(self, duration_column='duration_minutes'):
+    def _report_columns(self, *value_columns, district_column='district'):
+        """Identifier columns present in the data followed by the checked value columns"""
+        id_columns = list(REPORT_ID_COLUMNS)
+        id_columns.insert(id_columns.index('respondent_name') + 1, district_column)
+        id_columns = [col for col in dict.fromkeys(id_columns)
+                      if col in self.data.columns and col not in value_columns]
+        return id_columns + list(value_columns)
+    
+    def flag_interview_durations(self, duration_column='duration_minutes', district_column='district'):
         """
         Flag interviews with suspicious durations
         
@@ -177,6 +685,8 @@ class ONAQualityDashboard:
         -----------
         duration_column : str
             Name of the column containing interview duration in minutes
+        district_column : str
+            Name of the district column carried into the report
         
         Returns:
         --------
@@ -190,18 +700,26 @@ class ONAQualityDashboard:
         min_dur = self.config['min_duration']
         max_dur = self.config['max_duration']
         
-        flagged = self.data[
-            (self.data[duration_column] < min_dur) | 
-            (self.data[duration_column] > max_dur)
-        ].copy()
+        cache_key = ('duration_flags', duration_column, district_column, min_dur, max_dur)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
         
-        flagged['flag_reason'] = flagged[duration_column].apply(
-            lambda x: f'Too short (<{min_dur} min)' if x < min_dur else f'Too long (>{max_dur} min)'
+        durations = self.data[duration_column].to_numpy(dtype=float, na_value=np.nan)
+        too_short = durations < min_dur
+        is_flagged = too_short | (durations > max_dur)
+        
+        # Only the identifying columns and the duration, not the whole row
+        flagged = self.data.loc[is_flagged, self._report_columns(duration_column, district_column=district_column)].assign(
+            flag_reason=np.where(
+                too_short[is_flagged], f'Too short (<{min_dur} min)', f'Too long (>{max_dur} min)'
+            )
         )
         
+        self._cache[cache_key] = flagged
         return flagged
     
-    def verify_gps_coordinates(self, lat_column='latitude', lon_column='longitude'):
+    def verify_gps_coordinates(self, lat_column='latitude', lon_column='longitude',
+                               district_column='district'):
         """
         Verify GPS coordinates are within target areas
         
@@ -211,6 +729,8 @@ class ONAQualityDashboard:
             Name of the latitude column
         lon_column : str
             Name of the longitude column
+        district_column : str
+            Name of the district column carried into the report
         
         Returns:
         --------
@@ -221,49 +741,127 @@ class ONAQualityDashboard:
             print(f"Warning: GPS columns not found")
             return pd.DataFrame()
         
-        issues = []
-        
-        # Check for missing GPS
-        missing_gps = self.data[
-            self.data[lat_column].isna() | self.data[lon_column].isna()
-        ].copy()
-        
-        if len(missing_gps) > 0:
-            missing_gps['gps_issue'] = 'Missing GPS coordinates'
-            issues.append(missing_gps)
+        bounds = self.config['target_boundaries']
+        cache_key = ('gps_issues', lat_column, lon_column, district_column,
+                     tuple(sorted(bounds.items())) if bounds else None)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
         
-        # Check for invalid coordinates (latitude: -90 to 90, longitude: -180 to 180)
-        valid_data = self.data[
-            self.data[lat_column].notna() & self.data[lon_column].notna()
-        ]
+        lat = self.data[lat_column].to_numpy(dtype=float, na_value=np.nan)
+        lon = self.data[lon_column].to_numpy(dtype=float, na_value=np.nan)
         
-        invalid_coords = valid_data[
-            (valid_data[lat_column] < -90) | (valid_data[lat_column] > 90) |
-            (valid_data[lon_column] < -180) | (valid_data[lon_column] > 180)
-        ].copy()
-        
-        if len(invalid_coords) > 0:
-            invalid_coords['gps_issue'] = 'Invalid GPS coordinates'
-            issues.append(invalid_coords)
-        
-        # Check if coordinates are within target boundaries
-        if self.config['target_boundaries']:
-            bounds = self.config['target_boundaries']
-            out_of_bounds = valid_data[
-                (valid_data[lat_column] < bounds['lat_min']) |
-                (valid_data[lat_column] > bounds['lat_max']) |
-                (valid_data[lon_column] < bounds['lon_min']) |
-                (valid_data[lon_column] > bounds['lon_max'])
-            ].copy()
+        # Classify every row in one pass; the first matching check wins
+        if numba is not None and len(lat) >= NUMBA_GPS_MIN_ROWS:
+            # Fused kernel, no temporary mask per comparison
+            issue_codes = np.empty(len(lat), dtype=np.uint8)
+            if bounds:
+                limits = (bounds['lat_min'], bounds['lat_max'], bounds['lon_min'], bounds['lon_max'])
+            else:
+                limits = (-np.inf, np.inf, -np.inf, np.inf)
+            _classify_gps(lat, lon, *map(float, limits), issue_codes)
+        else:
+            # Missing GPS
+            conditions = [np.isnan(lat) | np.isnan(lon)]
+            
+            # Invalid coordinates (latitude: -90 to 90, longitude: -180 to 180)
+            conditions.append((np.abs(lat) > 90) | (np.abs(lon) > 180))
             
-            if len(out_of_bounds) > 0:
-                out_of_bounds['gps_issue'] = 'Outside target boundaries'
-                issues.append(out_of_bounds)
+            # Outside target boundaries
+            if bounds:
+                conditions.append(
+                    (lat < bounds['lat_min']) | (lat > bounds['lat_max']) |
+                    (lon < bounds['lon_min']) | (lon > bounds['lon_max'])
+                )
+            
+            issue_codes = np.select(conditions, np.arange(1, len(conditions) + 1), default=0)
         
-        if issues:
-            return pd.concat(issues, ignore_index=True)
+        # Group the report by issue type, keeping row order within each type
+        rows = np.flatnonzero(issue_codes)
+        if len(rows) > 0:
+            rows = rows[np.argsort(issue_codes[rows], kind='stable')]
+            columns = self.data.columns.get_indexer(self._report_columns(
+                lat_column, lon_column, district_column=district_column
+            ))
+            issues = self.data.iloc[rows, columns].reset_index(drop=True)
+            issues['gps_issue'] = GPS_ISSUE_LABELS[issue_codes[rows]]
         else:
-            return pd.DataFrame()
+            issues = pd.DataFrame()
+        
+        self._cache[cache_key] = issues
+        return issues
+    
+    def _date_column(self):
+        """Column used for the daily submission trend, or None"""
+        if 'submission_time' in self.data.columns:
+            return 'submission_time'
+        date_columns = [col for col in self.data.columns if 'date' in col.lower()]
+        return date_columns[0] if date_columns else None
+    
+    def _submission_count(self):
+        """Total number of submissions in the export"""
+        return self._cache.get('submission_count', len(self.data))
+    
+    def _collection_period(self):
+        """(first, last) submission time, or None without a submission_time column"""
+        if 'collection_period' not in self._cache:
+            if 'submission_time' not in self.data.columns:
+                return None
+            self._cache['collection_period'] = (
+                self.data['submission_time'].min(), self.data['submission_time'].max()
+            )
+        return self._cache['collection_period']
+    
+    def _duration_histogram(self, duration_column):
+        """(counts, bin_edges) for 30 duration bins, or None without the column"""
+        cache_key = ('duration_histogram', duration_column)
+        if cache_key not in self._cache:
+            if duration_column not in self.data.columns:
+                return None
+            # Bin here and ship 30 bars rather than every duration value
+            durations = self.data[duration_column].dropna().to_numpy(dtype=np.float32)
+            self._cache[cache_key] = np.histogram(durations, bins=30)
+        return self._cache[cache_key]
+    
+    def _daily_submission_counts(self):
+        """Submissions per day, or None without a date column"""
+        if 'daily_counts' not in self._cache:
+            date_col = self._date_column()
+            if date_col is None:
+                return None
+            # Stay in datetime64 rather than building a Python date per row
+            submission_days = self.data[date_col].dt.floor('D')
+            daily_counts = self.data.groupby(submission_days).size()
+            # Plotly only recognises numpy-backed datetimes as dates
+            daily_counts.index = pd.DatetimeIndex(daily_counts.index)
+            self._cache['daily_counts'] = daily_counts
+        return self._cache['daily_counts']
+    
+    def _map_points(self, lat_column, lon_column):
+        """Rows with coordinates to draw on the map, sampled down to MAX_MAP_POINTS"""
+        cache_key = ('map_points', lat_column, lon_column)
+        if cache_key not in self._cache:
+            if lat_column not in self.data.columns or lon_column not in self.data.columns:
+                return None
+            valid_gps = self.data[
+                self.data[lat_column].notna() & self.data[lon_column].notna()
+            ]
+            
+            if len(valid_gps) > MAX_MAP_POINTS:
+                # A fixed seed keeps the sample stable between refreshes
+                rng = np.random.default_rng(0)
+                sample = np.sort(rng.choice(len(valid_gps), MAX_MAP_POINTS, replace=False))
+                valid_gps = valid_gps.iloc[sample]
+            self._cache[cache_key] = valid_gps
+        return self._cache[cache_key]
+    
+    def _map_center(self, lat_column, lon_column):
+        """(lat, lon) the map is centred on: the mean of all coordinates"""
+        cache_key = ('map_center', lat_column, lon_column)
+        if cache_key not in self._cache:
+            if lat_column not in self.data.columns or lon_column not in self.data.columns:
+                return (0, 0)
+            self._cache[cache_key] = (self.data[lat_column].mean(), self.data[lon_column].mean())
+        return self._cache[cache_key]
     
     def generate_dashboard(self, output_file='ona_quality_dashboard.html', 
                           district_column='district',
@@ -286,11 +884,17 @@ class ONAQualityDashboard:
         lon_column : str
             Name of longitude column
         """
-        # Calculate all metrics
-        completion_rates = self.calculate_completion_rates(district_column)
-        missing_data = self.analyze_missing_data()
-        duration_flags = self.flag_interview_durations(duration_column)
-        gps_issues = self.verify_gps_coordinates(lat_column, lon_column)
+        # Calculate all metrics; they only read self.data, so run them side by side
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = (
+                executor.submit(self.calculate_completion_rates, district_column),
+                executor.submit(self.analyze_missing_data),
+                executor.submit(self.flag_interview_durations, duration_column, district_column),
+                executor.submit(self.verify_gps_coordinates, lat_column, lon_column, district_column),
+            )
+            completion_rates, missing_data, duration_flags, gps_issues = (
+                future.result() for future in futures
+            )
         
         # Create subplots
         fig = make_subplots(
@@ -313,52 +917,44 @@ class ONAQualityDashboard:
             horizontal_spacing=0.15
         )
         
+        # Traces are queued as (trace, row, col) and added in one add_traces call
+        panels = []
+        
         # 1. Completion rates by district
         if not completion_rates.empty:
-            fig.add_trace(
+            panels.append((
                 go.Bar(
                     x=completion_rates[district_column],
                     y=completion_rates['completion_rate'],
                     name='Completion Rate',
                     marker_color='#2E86AB',
                     text=completion_rates['completion_rate'].apply(lambda x: f'{x:.1f}%'),
-                    textposition='outside'
+                    textposition='outside',
+                    _validate=False
                 ),
-                row=1, col=1
-            )
+                1, 1
+            ))
         
         # 2. Interview duration distribution
-        if duration_column in self.data.columns:
-            fig.add_trace(
-                go.Histogram(
-                    x=self.data[duration_column].dropna(),
+        histogram = self._duration_histogram(duration_column)
+        if histogram is not None:
+            counts, edges = histogram
+            panels.append((
+                go.Bar(
+                    x=0.5 * (edges[1:] + edges[:-1]),
+                    y=counts,
+                    width=edges[1] - edges[0],
                     name='Duration',
                     marker_color='#A23B72',
-                    nbinsx=30
+                    _validate=False
                 ),
-                row=1, col=2
-            )
-            
-            # Add vertical lines for thresholds
-            fig.add_vline(
-                x=self.config['min_duration'], 
-                line_dash="dash", 
-                line_color="red",
-                annotation_text=f"Min: {self.config['min_duration']}",
-                row=1, col=2
-            )
-            fig.add_vline(
-                x=self.config['max_duration'], 
-                line_dash="dash", 
-                line_color="red",
-                annotation_text=f"Max: {self.config['max_duration']}",
-                row=1, col=2
-            )
+                1, 2
+            ))
         
         # 3. Top 10 fields with missing data
         if not missing_data.empty:
             top_missing = missing_data.head(10)
-            fig.add_trace(
+            panels.append((
                 go.Bar(
                     y=top_missing['field'],
                     x=top_missing['missing_percentage'],
@@ -366,51 +962,47 @@ class ONAQualityDashboard:
                     orientation='h',
                     marker_color='#F18F01',
                     text=top_missing['missing_percentage'].apply(lambda x: f'{x:.1f}%'),
-                    textposition='outside'
+                    textposition='outside',
+                    _validate=False
                 ),
-                row=2, col=1
-            )
+                2, 1
+            ))
         
         # 4. Daily submission trends
-        if 'submission_time' in self.data.columns or any('date' in col.lower() for col in self.data.columns):
-            # Find the date column
-            date_col = 'submission_time' if 'submission_time' in self.data.columns else \
-                       [col for col in self.data.columns if 'date' in col.lower()][0]
-            
-            daily_counts = self.data[date_col].dt.date.value_counts().sort_index()
-            
-            fig.add_trace(
+        daily_counts = self._daily_submission_counts()
+        if daily_counts is not None:
+            panels.append((
                 go.Scatter(
                     x=daily_counts.index,
                     y=daily_counts.values,
                     mode='lines+markers',
                     name='Submissions',
                     marker_color='#06A77D',
-                    line=dict(width=2)
+                    line=dict(width=2),
+                    _validate=False
                 ),
-                row=2, col=2
-            )
+                2, 2
+            ))
         
         # 5. GPS coordinate map
-        if lat_column in self.data.columns and lon_column in self.data.columns:
-            valid_gps = self.data[
-                self.data[lat_column].notna() & self.data[lon_column].notna()
-            ]
-            
+        valid_gps = self._map_points(lat_column, lon_column)
+        if valid_gps is not None:
             if len(valid_gps) > 0:
-                fig.add_trace(
+                panels.append((
                     go.Scattermapbox(
                         lat=valid_gps[lat_column],
                         lon=valid_gps[lon_column],
                         mode='markers',
                         marker=dict(size=8, color='#2E86AB'),
                         name='Interview Locations',
-                        text=valid_gps.get(district_column, 'Location')
+                        text=valid_gps.get(district_column, 'Location'),
+                        _validate=False
                     ),
-                    row=3, col=1
-                )
+                    3, 1
+                ))
         
         # 6. Summary table
+        period = self._collection_period()
         summary_data = {
             'Metric': [
                 'Total Submissions',
@@ -421,17 +1013,16 @@ class ONAQualityDashboard:
                 'Data Collection Period'
             ],
             'Value': [
-                f"{len(self.data):,}",
+                f"{self._submission_count():,}",
                 f"{completion_rates['completion_rate'].mean():.1f}%" if not completion_rates.empty else 'N/A',
                 f"{missing_data['missing_count'].sum():,.0f}" if not missing_data.empty else '0',
                 f"{len(duration_flags):,}",
                 f"{len(gps_issues):,}",
-                f"{self.data['submission_time'].min().date()} to {self.data['submission_time'].max().date()}" 
-                if 'submission_time' in self.data.columns else 'N/A'
+                f"{period[0].date()} to {period[1].date()}" if period is not None else 'N/A'
             ]
         }
         
-        fig.add_trace(
+        panels.append((
             go.Table(
                 header=dict(
                     values=['<b>Metric</b>', '<b>Value</b>'],
@@ -444,10 +1035,34 @@ class ONAQualityDashboard:
                     fill_color='#F0F0F0',
                     align='left',
                     font=dict(size=11)
-                )
+                ),
+                _validate=False
             ),
-            row=3, col=2
-        )
+            3, 2
+        ))
+        
+        traces, rows, cols = zip(*panels)
+        fig.add_traces(list(traces), rows=list(rows), cols=list(cols))
+        
+        # Add vertical lines for thresholds; the histogram is known to be there, and
+        # plotly's empty-subplot check fails on figures holding Table traces
+        if histogram is not None:
+            fig.add_vline(
+                x=self.config['min_duration'], 
+                line_dash="dash", 
+                line_color="red",
+                annotation_text=f"Min: {self.config['min_duration']}",
+                row=1, col=2,
+                exclude_empty_subplots=False
+            )
+            fig.add_vline(
+                x=self.config['max_duration'], 
+                line_dash="dash", 
+                line_color="red",
+                annotation_text=f"Max: {self.config['max_duration']}",
+                row=1, col=2,
+                exclude_empty_subplots=False
+            )
         
         # Update layout
         fig.update_layout(
@@ -477,19 +1092,17 @@ class ONAQualityDashboard:
         fig.update_yaxes(title_text="Number of Submissions", row=2, col=2)
         
         # Update mapbox for GPS visualization
+        center_lat, center_lon = self._map_center(lat_column, lon_column)
         fig.update_layout(
             mapbox=dict(
                 style="open-street-map",
-                center=dict(
-                    lat=self.data[lat_column].mean() if lat_column in self.data.columns else 0,
-                    lon=self.data[lon_column].mean() if lon_column in self.data.columns else 0
-                ),
+                center=dict(lat=center_lat, lon=center_lon),
                 zoom=8
             )
         )
         
         # Save dashboard
-        fig.write_html(output_file)
+        _write_dashboard_html(fig, output_file)
         print(f"Dashboard saved to: {output_file}")
         
         return fig
@@ -507,7 +1120,11 @@ class ONAQualityDashboard:
         output_file : str
             Output Excel file path
         """
-        with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+        # xlsxwriter writes cells straight to the sheet XML instead of building an
+        # openpyxl Cell object per value. constant_memory is left off: pandas
+        # emits cells column by column, which that mode silently drops.
+        engine = 'xlsxwriter' if xlsxwriter is not None else 'openpyxl'
+        with pd.ExcelWriter(output_file, engine=engine) as writer:
             # Summary sheet
             completion_rates = self.calculate_completion_rates(district_column)
             completion_rates.to_excel(writer, sheet_name='Completion Rates', index=False)
@@ -517,12 +1134,12 @@ class ONAQualityDashboard:
             missing_data.to_excel(writer, sheet_name='Missing Data', index=False)
             
             # Duration flags sheet
-            duration_flags = self.flag_interview_durations(duration_column)
+            duration_flags = self.flag_interview_durations(duration_column, district_column)
             if not duration_flags.empty:
                 duration_flags.to_excel(writer, sheet_name='Duration Flags', index=False)
             
             # GPS issues sheet
-            gps_issues = self.verify_gps_coordinates(lat_column, lon_column)
+            gps_issues = self.verify_gps_coordinates(lat_column, lon_column, district_column)
             if not gps_issues.empty:
                 gps_issues.to_excel(writer, sheet_name='GPS Issues', index=False)
         
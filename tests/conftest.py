@@ -0,0 +1,62 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def small_export(tmp_path):
+    """A small ONA export with dates, districts, durations, GPS and a few gaps"""
+    rng = np.random.default_rng(0)
+    n_rows = 60
+    end = pd.Timestamp('2026-10-06 15:00') - pd.to_timedelta(rng.integers(0, 10 * 24 * 60, n_rows), unit='min')
+    start = end - pd.to_timedelta(rng.integers(10, 180, n_rows), unit='min')
+    latitude = rng.uniform(2.0, 9.0, n_rows)
+    latitude[::11] = np.nan
+    respondent = np.array(['resp'] * n_rows, dtype=object)
+    respondent[::7] = None
+    frame = pd.DataFrame({
+        'submission_time': end.strftime('%Y-%m-%dT%H:%M:%S'),
+        'start_time': start.strftime('%Y-%m-%d %H:%M:%S'),
+        'end_time': end.strftime('%Y-%m-%d %H:%M:%S'),
+        'district': rng.choice(['Beletweyne', 'Gabiley', 'Baidoa'], n_rows),
+        'respondent_name': respondent,
+        'survey_complete': rng.choice(['yes', 'no'], n_rows),
+        'latitude': latitude,
+        'longitude': rng.uniform(41.0, 48.0, n_rows),
+        'age': rng.integers(-5, 130, n_rows),
+    })
+    path = tmp_path / 'export.csv'
+    frame.to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.fixture
+def ona_export(tmp_path):
+    """A small raw ONA export as the enhanced dashboard reads it, with gaps in several columns"""
+    rng = np.random.default_rng(1)
+    n_rows = 80
+    end = pd.Timestamp.now().floor('min') - pd.to_timedelta(rng.integers(0, 5 * 24 * 60, n_rows), unit='min')
+    start = end - pd.to_timedelta(rng.integers(10, 180, n_rows), unit='min')
+    treatment = rng.choice(np.array(['Beneficiary', 'NotBeneficiary', None], dtype=object), n_rows)
+    latitude = rng.uniform(8.0, 11.0, n_rows)
+    latitude[::9] = np.nan
+    frame = pd.DataFrame({
+        'start': start.strftime('%Y-%m-%dT%H:%M:%S.000+03:00'),
+        'end': end.strftime('%Y-%m-%dT%H:%M:%S.000+03:00'),
+        'today': end.strftime('%Y-%m-%d'),
+        '_submission_time': end.strftime('%Y-%m-%dT%H:%M:%S'),
+        'District_id': rng.choice(['Baki', 'Gabiley', 'Beletweyne'], n_rows),
+        'enumerator_name': rng.choice([f'enum_{i:02d}' for i in range(12)], n_rows),
+        'respondent_information/treatment': treatment,
+        'duration_minutes': ((end - start).total_seconds() / 60).round(2),
+        'latitude': latitude,
+        'longitude': rng.uniform(43.0, 48.0, n_rows),
+    })
+    path = tmp_path / 'ona_export.csv'
+    frame.to_csv(path, index=False)
+    return str(path)
@@ -0,0 +1,68 @@
+import os
+
+import pandas as pd
+
+from ona_quality_dashboard_backup import ONAQualityDashboard
+
+
+def test_parquet_cache_is_opt_in(small_export):
+    dashboard = ONAQualityDashboard(small_export)
+    
+    assert dashboard.cache_dir is None
+
+
+def test_parquet_cache_keeps_only_the_newest_entry(small_export, tmp_path):
+    cache_dir = tmp_path / 'cache'
+    dashboard = ONAQualityDashboard(small_export, config={'cache_dir': str(cache_dir)})
+    assert dashboard.load_data()
+    first_run = [path.name for path in cache_dir.iterdir()]
+    
+    # A refreshed export: same path, new mtime
+    stat = os.stat(small_export)
+    os.utime(small_export, (stat.st_atime, stat.st_mtime + 60))
+    dashboard = ONAQualityDashboard(small_export, config={'cache_dir': str(cache_dir)})
+    assert dashboard.load_data()
+    second_run = [path.name for path in cache_dir.iterdir()]
+    
+    assert len(first_run) == len(second_run) == 1
+    assert first_run != second_run
+    assert second_run == [dashboard._parquet_cache_path().name]
+
+
+def test_top_k_breaks_ties_by_first_appearance():
+    names = pd.Series(['Hodan', 'Abdi', 'Warsame', 'Abdi', 'Hodan', 'Zahra', None, 'Bashir', 'Warsame'])
+    
+    for series in (names, names.astype('category').cat.add_categories(['Unseen'])):
+        top_names, top_counts = ONAQualityDashboard._top_k(series, 4)
+        assert list(top_names) == ['Hodan', 'Abdi', 'Warsame', 'Zahra']
+        assert list(top_counts) == [2, 2, 2, 1]
+
+
+def test_generate_dashboard_end_to_end(ona_export, tmp_path):
+    dashboard = ONAQualityDashboard(ona_export, config={'max_duration': 120})
+    assert dashboard.load_data()
+    assert dashboard.df.isnull().any().any()
+    output_file = tmp_path / 'dashboard.html'
+    
+    assert dashboard.generate_dashboard(output_file=str(output_file))
+    
+    html = output_file.read_text(encoding='utf-8')
+    assert 'Plotly.newPlot' in html
+    assert 'Missing Data Patterns' in html
+
+
+def test_data_signature_changes_with_the_settings(ona_export):
+    dashboard = ONAQualityDashboard(ona_export)
+    assert dashboard.load_data()
+    signature = dashboard._data_signature('dashboard.html')
+    
+    dashboard.config['max_duration'] = 90
+    assert dashboard._data_signature('dashboard.html') != signature
+    signature = dashboard._data_signature('dashboard.html')
+    
+    dashboard.district_targets['Gabiley'] += 10
+    assert dashboard._data_signature('dashboard.html') != signature
+    signature = dashboard._data_signature('dashboard.html')
+    
+    dashboard.target_districts.append('Hargeisa')
+    assert dashboard._data_signature('dashboard.html') != signature
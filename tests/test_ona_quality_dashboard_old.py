@@ -0,0 +1,187 @@
+import os
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from ona_quality_dashboard_old import ONAQualityDashboard
+
+CONFIG = {
+    'min_duration': 30,
+    'max_duration': 120,
+    'required_fields': ['respondent_name', 'district', 'survey_complete'],
+    'target_boundaries': {'lat_min': 0.0, 'lat_max': 10.0, 'lon_min': 40.0, 'lon_max': 49.0},
+}
+
+
+def test_generate_dashboard_end_to_end(small_export, tmp_path):
+    dashboard = ONAQualityDashboard(small_export, config=CONFIG)
+    output_file = tmp_path / 'dashboard.html'
+    
+    fig = dashboard.generate_dashboard(output_file=str(output_file))
+    
+    assert isinstance(fig, go.Figure)
+    assert any(trace.name == 'Duration' for trace in fig.data)
+    assert any(isinstance(trace, go.Table) for trace in fig.data)
+    # Min/max duration thresholds on the histogram
+    assert len([shape for shape in fig.layout.shapes if shape.type == 'line']) == 2
+    html = output_file.read_text(encoding='utf-8')
+    assert 'Plotly.newPlot' in html
+
+
+def test_logical_checks_evaluate_each_string_rule_once(small_export, monkeypatch):
+    dashboard = ONAQualityDashboard(small_export, config=CONFIG)
+    rules = [
+        {'name': 'negative age', 'condition': 'age < 0', 'fields': ['age']},
+        {'name': 'implausible age', 'condition': 'age > 120', 'fields': ['age']},
+        {'name': 'callable age', 'condition': lambda df: df['age'] > 125, 'fields': ['age']},
+    ]
+    eval_calls = []
+    original_eval = pd.DataFrame.eval
+    
+    def counting_eval(self, expr, *args, **kwargs):
+        eval_calls.append(expr)
+        return original_eval(self, expr, *args, **kwargs)
+    
+    monkeypatch.setattr(pd.DataFrame, 'eval', counting_eval)
+    result = dashboard.check_logical_inconsistencies(rules)
+    
+    # Both string rules go through the single batched eval call
+    assert len(eval_calls) == 1
+    age = dashboard.data['age']
+    assert result['rule'].tolist() == ['negative age', 'implausible age', 'callable age']
+    assert result['violations'].tolist() == [(age < 0).sum(), (age > 120).sum(), (age > 125).sum()]
+
+
+def test_parquet_cache_is_opt_in(small_export):
+    dashboard = ONAQualityDashboard(small_export, config=CONFIG)
+    
+    assert dashboard._cache_dir is None
+
+
+def test_parquet_cache_keeps_only_the_current_export_version(small_export, tmp_path):
+    cache_dir = tmp_path / 'cache'
+    config = dict(CONFIG, cache_dir=str(cache_dir))
+    ONAQualityDashboard(small_export, config=config).analyze_missing_data()
+    first_run = sorted(path.name for path in cache_dir.iterdir())
+    
+    # A refreshed export: same path, new mtime
+    stat = os.stat(small_export)
+    os.utime(small_export, (stat.st_atime, stat.st_mtime + 60))
+    dashboard = ONAQualityDashboard(small_export, config=config)
+    dashboard.analyze_missing_data()
+    second_run = sorted(path.name for path in cache_dir.iterdir())
+    
+    assert len(second_run) == len(first_run) == 2
+    assert not set(first_run) & set(second_run)
+    assert all(name.startswith(dashboard._parquet_cache_version()) for name in second_run)
+
+
+def assert_same_rows(expected, actual):
+    # The chunked reader and the in-memory reader pick different (Arrow) dtypes
+    pd.testing.assert_frame_equal(
+        expected.reset_index(drop=True), actual.reset_index(drop=True), check_dtype=False
+    )
+
+
+def test_from_large_csv_matches_in_memory_metrics(small_export):
+    in_memory = ONAQualityDashboard(small_export, config=CONFIG)
+    chunked = ONAQualityDashboard.from_large_csv(small_export, config=CONFIG, chunksize=17)
+    
+    assert_same_rows(in_memory.calculate_completion_rates(), chunked.calculate_completion_rates())
+    assert_same_rows(in_memory.analyze_missing_data(), chunked.analyze_missing_data())
+    assert_same_rows(in_memory.flag_interview_durations(), chunked.flag_interview_durations())
+    assert_same_rows(in_memory.verify_gps_coordinates(), chunked.verify_gps_coordinates())
+
+
+def test_from_large_csv_skips_logical_checks(small_export, capsys):
+    chunked = ONAQualityDashboard.from_large_csv(small_export, config=CONFIG, chunksize=17)
+    
+    result = chunked.check_logical_inconsistencies([{'name': 'negative age', 'condition': 'age < 0'}])
+    
+    assert result.empty
+    assert 'skipping logical checks' in capsys.readouterr().out
+
+
+def test_parquet_cache_round_trip(small_export, tmp_path):
+    config = dict(CONFIG, cache_dir=str(tmp_path / 'cache'))
+    first = ONAQualityDashboard(small_export, config=config)
+    first_metrics = (first.calculate_completion_rates(), first.analyze_missing_data())
+    
+    second = ONAQualityDashboard(small_export, config=config)
+    
+    assert second._read_parquet_cache(('data',)) is not None
+    pd.testing.assert_frame_equal(first.data, second.data)
+    pd.testing.assert_frame_equal(first_metrics[0], second.calculate_completion_rates())
+    pd.testing.assert_frame_equal(first_metrics[1], second.analyze_missing_data())
+
+
+def test_load_falls_back_when_a_column_changes_type_late(tmp_path):
+    path = tmp_path / 'late.csv'
+    household_size = [str(i % 7 + 1) for i in range(12_000)]
+    household_size[-1] = 'unknown'
+    pd.DataFrame({'district': 'Gabiley', 'household_size': household_size}).to_csv(path, index=False)
+    
+    dashboard = ONAQualityDashboard(str(path), config=CONFIG)
+    
+    assert len(dashboard.data) == 12_000
+    assert dashboard.data['household_size'].iloc[-1] == 'unknown'
+
+
+def test_offset_timestamps_are_bucketed_on_local_days(tmp_path):
+    path = tmp_path / 'offset.csv'
+    times = pd.date_range('2026-01-01 00:30', periods=50, freq='61min')
+    pd.DataFrame({
+        'submission_time': times.strftime('%Y-%m-%dT%H:%M:%S+03:00'),
+        'district': 'Gabiley',
+    }).to_csv(path, index=False)
+    
+    dashboard = ONAQualityDashboard(str(path), config=CONFIG)
+    
+    daily_counts = dashboard._daily_submission_counts()
+    assert [day.strftime('%Y-%m-%d') for day in daily_counts.index] == ['2026-01-01', '2026-01-02', '2026-01-03']
+    assert daily_counts.tolist() == [24, 23, 3]
+    first, last = dashboard._collection_period()
+    assert (first.hour, first.minute) == (0, 30)
+
+
+def test_non_iso_dates_are_parsed(tmp_path):
+    path = tmp_path / 'non_iso.csv'
+    times = pd.date_range('2026-01-05 08:00', periods=30, freq='3h')
+    pd.DataFrame({
+        'visit_date': times.strftime('%d %b %Y'),
+        'start_time': (times - pd.Timedelta('45min')).strftime('%m/%d/%Y %H:%M'),
+        'end_time': times.strftime('%m/%d/%Y %H:%M'),
+        'district': 'Gabiley',
+    }).to_csv(path, index=False)
+    
+    dashboard = ONAQualityDashboard(str(path), config=dict(CONFIG, required_fields=[]))
+    
+    assert dashboard.data['duration_minutes'].tolist() == [45.0] * 30
+    assert dashboard._daily_submission_counts().sum() == 30
+    dashboard.generate_dashboard(output_file=str(tmp_path / 'dashboard.html'))
+
+
+def test_from_large_csv_duration_histogram_matches_in_memory(small_export):
+    in_memory = ONAQualityDashboard(small_export, config=CONFIG)
+    chunked = ONAQualityDashboard.from_large_csv(small_export, config=CONFIG, chunksize=17)
+    
+    expected_counts, expected_edges = in_memory._duration_histogram('duration_minutes')
+    counts, edges = chunked._duration_histogram('duration_minutes')
+    
+    np.testing.assert_array_equal(counts, expected_counts)
+    np.testing.assert_array_equal(edges, expected_edges)
+
+
+def test_issue_reports_keep_a_custom_district_column(small_export):
+    path = small_export.replace('.csv', '_region.csv')
+    pd.read_csv(small_export).rename(columns={'district': 'region'}).to_csv(path, index=False)
+    config = dict(CONFIG, required_fields=['respondent_name', 'region', 'survey_complete'])
+    
+    for dashboard in (ONAQualityDashboard(path, config=config),
+                      ONAQualityDashboard.from_large_csv(path, config=config, chunksize=17,
+                                                         district_column='region')):
+        duration_flags = dashboard.flag_interview_durations('duration_minutes', 'region')
+        gps_issues = dashboard.verify_gps_coordinates('latitude', 'longitude', 'region')
+        assert 'region' in duration_flags.columns
+        assert 'region' in gps_issues.columns